@@ -8,6 +8,7 @@ import re
 from typing import Any, Dict, Optional, Tuple
 from rich.console import Console
 
+from q_cli.utils.constants import CONFIG_PATH
 from q_cli.utils.helpers import sanitize_context
 from q_cli.io.config import build_context
 from q_cli.utils.prompts import get_system_prompt
@@ -49,50 +50,63 @@ def setup_context_and_prompts(
 
     # Get user context from q.conf
     user_context = ""
-    from q_cli.utils.constants import CONFIG_PATH
-    if os.path.exists(CONFIG_PATH):
+    try:
         with open(CONFIG_PATH, "r") as f:
             content = f.read()
-            # Find the CONTEXT section - look for both [CONTEXT] and #CONTEXT formats
-            context_match = re.search(r'\[CONTEXT\](.*?)(\n\[|\Z)', content, re.DOTALL)
-            if not context_match:
-                # Try the alternate format with # instead of []
-                # This captures everything after the #CONTEXT line until the end of file 
-                # Using a more robust pattern that is specific to the structure of the config file
-                # Skip comment lines to get to the actual content
-                context_match = re.search(r'#CONTEXT.*?\n((?:- .*\n)+)', content, re.DOTALL)
-            
-            if context_match:
-                user_context = context_match.group(1).strip()
+    except FileNotFoundError:
+        content = ""
+    if content:
+        # Find the CONTEXT section - look for both [CONTEXT] and #CONTEXT formats
+        context_match = re.search(r'\[CONTEXT\](.*?)(\n\[|\Z)', content, re.DOTALL)
+        if not context_match:
+            # Try the alternate format with # instead of []
+            # This captures everything after the #CONTEXT line until the end of file 
+            # Using a more robust pattern that is specific to the structure of the config file
+            # Skip comment lines to get to the actual content
+            context_match = re.search(r'#CONTEXT.*?\n((?:- .*\n)+)', content, re.DOTALL)
+        
+        if context_match:
+            user_context = context_match.group(1).strip()
     
     # Get project context from .Q/project.md and list available files in .Q directory
-    project_context = ""
+    # Sections are collected in a list and joined once at the end
+    project_sections = []
     q_dir_path = os.path.join(os.getcwd(), ".Q")
-    project_md_path = os.path.join(q_dir_path, "project.md")
-    
-    # Read project.md content if exists
-    if os.path.isdir(q_dir_path) and os.path.isfile(project_md_path):
-        try:
-            with open(project_md_path, "r") as f:
-                project_context = f.read().strip()
-        except Exception:
-            pass
-            
-    # Add list of files in .Q directory if it exists
-    if os.path.isdir(q_dir_path):
-        try:
-            q_files = os.listdir(q_dir_path)
-            if q_files:
-                # Filter out project.md as it's already included in content
-                other_files = [f for f in q_files if f != "project.md"]
-                if other_files:
-                    file_list = "\n".join([f"- {file}" for file in other_files])
-                    # Add file list to project_context
-                    if project_context:
-                        project_context += "\n\n"
-                    project_context += f"Additional project information can be found in the following files:\n{file_list}"
-        except Exception:
-            pass
+
+    # List the .Q directory in a single scandir pass, noting whether
+    # project.md is a regular file along the way
+    q_files = []
+    has_project_md = False
+    try:
+        with os.scandir(q_dir_path) as entries:
+            for entry in entries:
+                q_files.append(entry.name)
+                if entry.name == "project.md" and entry.is_file():
+                    has_project_md = True
+    except OSError:
+        q_files = []
+
+    if q_files:
+        # Read project.md content if exists
+        if has_project_md:
+            try:
+                with open(os.path.join(q_dir_path, "project.md"), "r") as f:
+                    project_md = f.read().strip()
+                if project_md:
+                    project_sections.append(project_md)
+            except Exception:
+                pass
+
+        # Add list of other files in .Q directory, as project.md is already
+        # included in content. Sorted so the prompt doesn't depend on the
+        # OS listing order
+        other_files = sorted(f for f in q_files if f != "project.md")
+        if other_files:
+            file_list = "\n".join(f"- {file}" for file in other_files)
+            project_sections.append(
+                f"Additional project information can be found in the following files:\n{file_list}"
+            )
+    project_context = "\n\n".join(project_sections)
     
     # Use variables instead of appending context
     system_prompt = get_system_prompt(
@@ -9,8 +9,10 @@ from q_cli.config.providers import (
     is_valid_model_for_provider,
     format_model_name,
     SUPPORTED_PROVIDERS,
+    PROVIDER_API_KEY_VARS,
     DEFAULT_PROVIDER
 )
+from q_cli.config.manager import strip_inline_comment
 from q_cli.utils.constants import get_debug
 
 
@@ -130,17 +132,18 @@ def setup_api_credentials(
     provider_kwargs = {}
 
     # Get API key based on provider
+    provider_lower = provider.lower()
     if args.api_key:
         # Use API key from args
         api_key = args.api_key
-    elif provider.lower() == "anthropic":
-        api_key = config_vars.get("ANTHROPIC_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
-    elif provider.lower() == "vertexai":
-        api_key = config_vars.get("VERTEXAI_API_KEY") or os.environ.get("VERTEXAI_API_KEY")
-        # Clean up any comments in the value if it's a string
-        if isinstance(api_key, str) and "#" in api_key:
-            api_key = api_key.split("#")[0].strip()
+    elif provider_lower in PROVIDER_API_KEY_VARS:
+        key_var = PROVIDER_API_KEY_VARS[provider_lower]
+        api_key = config_vars.get(key_var) or os.environ.get(key_var)
+    else:
+        # Fallback to generic API key or anthropic key for backward compatibility
+        api_key = config_api_key or os.environ.get("API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
 
+    if provider_lower == "vertexai" and not args.api_key:
         # Handle VertexAI project ID from config or environment
         project_id = (
             config_vars.get("VERTEXAI_PROJECT") or
@@ -149,8 +152,8 @@ def setup_api_credentials(
             os.environ.get("VERTEX_PROJECT")
         )
         # Clean up any comments in the project ID value
-        if isinstance(project_id, str) and "#" in project_id:
-            project_id = project_id.split("#")[0].strip()
+        if project_id and "#" in project_id:
+            project_id = strip_inline_comment(project_id)
         if project_id:
             provider_kwargs["project_id"] = project_id
             if get_debug():
@@ -170,8 +173,8 @@ def setup_api_credentials(
             os.environ.get("VERTEX_LOCATION")
         )
         # Clean up any comments in the location value
-        if isinstance(location, str) and "#" in location:
-            location = location.split("#")[0].strip()
+        if location and "#" in location:
+            location = strip_inline_comment(location)
         if location:
             provider_kwargs["location"] = location
             if get_debug():
@@ -182,22 +185,6 @@ def setup_api_credentials(
                 "Set VERTEXAI_LOCATION in config or environment.[/bold red]"
             )
             sys.exit(1)
-    elif provider.lower() == "groq":
-        api_key = config_vars.get("GROQ_API_KEY") or os.environ.get("GROQ_API_KEY")
-        # Clean up any comments in the value
-        if isinstance(api_key, str) and "#" in api_key:
-            api_key = api_key.split("#")[0].strip()
-    elif provider.lower() == "openai":
-        api_key = config_vars.get("OPENAI_API_KEY") or os.environ.get("OPENAI_API_KEY")
-        # Clean up any comments in the value
-        if isinstance(api_key, str) and "#" in api_key:
-            api_key = api_key.split("#")[0].strip()
-    else:
-        # Fallback to generic API key or anthropic key for backward compatibility
-        api_key = config_api_key or os.environ.get("API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
-        # Clean up any comments in the value
-        if isinstance(api_key, str) and "#" in api_key:
-            api_key = api_key.split("#")[0].strip()
 
     # Store provider_kwargs in args for later use when initializing client
     args.provider_kwargs = provider_kwargs
@@ -30,7 +30,6 @@ from q_cli.io.input import (
     get_initial_question
 )
 from q_cli.io.output import setup_console
-from q_cli.cli.conversation import run_conversation
 from q_cli.utils.constants import get_debug
 from q_cli.config.providers import (
     get_default_model,
@@ -133,6 +132,10 @@ def execute_conversation(
         auto_approve: Auto-approve flag
         session_manager: Session manager
     """
+    # Lazy import the conversation loop, and LiteLLM with it, only when a
+    # conversation actually runs
+    from q_cli.cli.conversation import run_conversation
+
     try:
         run_conversation(
             client,
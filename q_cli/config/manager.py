@@ -4,15 +4,19 @@ This module provides a unified interface for loading, validating, and accessing
 configuration from multiple sources (config files, environment variables, etc.).
 """
 
+import functools
 import os
 import re
 import json
+import shutil
+import tempfile
 from typing import Dict, Any, Tuple, Optional, List, Set
 from rich.console import Console
 
 from q_cli.config.providers import (
     DEFAULT_PROVIDER,
     SUPPORTED_PROVIDERS,
+    PROVIDER_API_KEY_VARS,
     get_provider_env_vars,
     get_default_model,
     get_max_tokens
@@ -22,6 +26,107 @@ from q_cli.config.commands import (
 )
 from q_cli.utils.constants import CONFIG_PATH
 
+# Lowercased provider names for case-insensitive membership checks
+_SUPPORTED_PROVIDERS_LOWER = frozenset(p.lower() for p in SUPPORTED_PROVIDERS)
+
+# Prefix of the config line holding the default provider
+PROVIDER_PREFIX = "PROVIDER="
+
+# Matches a "KEY=value" line, skipping blank and "#" comment lines. The key
+# must not start with whitespace so the leading-space match can't backtrack
+# into a comment line
+_CONFIG_LINE_RE = re.compile(r"^[^\S\n]*([^#\s=][^=\n]*)?=([^\n]*)", re.MULTILINE)
+
+# Matches an inline "# comment" and any whitespace before it
+_INLINE_COMMENT_RE = re.compile(r"\s*#.*$")
+
+
+def strip_inline_comment(value: str) -> str:
+    """Remove an inline comment from a config value.
+
+    Args:
+        value: Raw config value, possibly followed by "# comment"
+
+    Returns:
+        The value without the comment and surrounding whitespace
+    """
+    return _INLINE_COMMENT_RE.sub("", value, count=1).strip()
+
+
+def _atomic_write_lines(path: str, lines: List[str]) -> None:
+    """Replace a file's contents atomically.
+
+    The lines are written to a temporary file next to the target, which is
+    then renamed over it, so an interrupted write can't leave a truncated
+    config behind. The target's permission bits are preserved.
+
+    Args:
+        path: File to replace; symlinks are followed
+        lines: Lines to write, including line endings
+    """
+    target = os.path.realpath(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(target), prefix=".q.conf.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.writelines(lines)
+        try:
+            shutil.copymode(target, tmp_path)
+        except OSError:
+            pass
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config_file(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[Optional[str], Optional[str], Dict[str, Any]]:
+    """Parse a config file, cached on its path, mtime and size.
+
+    The mtime and size are part of the cache key only, so an edited file is
+    re-parsed automatically. Callers must copy the returned dict.
+
+    Args:
+        path: Path to the config file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        Tuple containing:
+        - API key (may be None)
+        - Context (may be None)
+        - Dictionary of configuration variables
+    """
+    api_key = None
+    context = None
+    config_vars: Dict[str, Any] = {}
+
+    with open(path, "r") as f:
+        text = f.read()
+
+    # One C-level pass over the file finds every KEY=value line
+    for match in _CONFIG_LINE_RE.finditer(text):
+        key = match.group(1) or ""
+        value = match.group(2)
+
+        # Check for API_KEY or context lines
+        if key == "API_KEY":
+            api_key = strip_inline_comment(value)
+        elif key == "CONTEXT":
+            context = value.strip()
+        else:
+            # Process other config variables, handling inline comments
+            config_vars[key.strip()] = strip_inline_comment(value)
+
+    return api_key, context, config_vars
+
 
 class ConfigManager:
     """Configuration manager for q_cli.
@@ -64,58 +169,27 @@ class ConfigManager:
             - Context (may be None)
             - Dictionary of configuration variables
         """
-        api_key = None
-        context = None
-        config_vars: Dict[str, Any] = {}
-        
         try:
-            # Check if config file exists
-            if not os.path.exists(CONFIG_PATH):
-                if os.path.exists(os.path.dirname(CONFIG_PATH)):
-                    # Directory exists but file doesn't, create empty file
-                    with open(CONFIG_PATH, "w") as f:
-                        f.write("# Q CLI Configuration\n")
-                    self.console.print(f"Created empty config file at {CONFIG_PATH}")
-                else:
-                    # Directory doesn't exist, create it
-                    os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-                    # Create empty file
-                    with open(CONFIG_PATH, "w") as f:
-                        f.write("# Q CLI Configuration\n")
-                    self.console.print(f"Created empty config file at {CONFIG_PATH}")
-                
+            # Stat the config file; only pay for the directory checks and file
+            # creation when it doesn't exist yet
+            try:
+                stat = os.stat(CONFIG_PATH)
+            except FileNotFoundError:
+                # Create the directory if needed, then an empty file
+                os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
+                with open(CONFIG_PATH, "w") as f:
+                    f.write("# Q CLI Configuration\n")
+                self.console.print(f"Created empty config file at {CONFIG_PATH}")
+
                 # Return empty config
                 return None, None, {}
-            
-            # Read config file
-            with open(CONFIG_PATH, "r") as f:
-                lines = f.readlines()
-                
-            # Process each line
-            for line in lines:
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-                
-                # Check for API_KEY or context lines
-                if line.startswith("API_KEY="):
-                    api_key = line[8:].strip()
-                elif line.startswith("CONTEXT="):
-                    context = line[8:].strip()
-                elif "=" in line:
-                    # Process other config variables
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Handle inline comments in values
-                    if "#" in value:
-                        value = value.split("#")[0].strip()
-                    
-                    config_vars[key] = value
-            
+
+            api_key, context, config_vars = _parse_config_file(
+                CONFIG_PATH, stat.st_mtime_ns, stat.st_size
+            )
+            # Copy so callers can't mutate the cached result
+            config_vars = dict(config_vars)
+
             # Store the configuration
             self.api_key = api_key
             self.context = context
@@ -136,14 +210,15 @@ class ConfigManager:
         """
         # Check for required provider-specific configuration
         provider = self.config_vars.get("PROVIDER", DEFAULT_PROVIDER)
+        provider_lower = provider.lower()
         
-        if provider.lower() not in map(str.lower, SUPPORTED_PROVIDERS):
+        if provider_lower not in _SUPPORTED_PROVIDERS_LOWER:
             self.console.print(f"[bold red]Error: Provider '{provider}' is not supported.[/bold red]")
             self.console.print(f"[bold red]Supported providers: {', '.join(SUPPORTED_PROVIDERS)}[/bold red]")
             return False
             
         # Validate provider-specific configuration
-        if provider.lower() == "vertexai":
+        if provider_lower == "vertexai":
             # VertexAI requires project_id and location
             project_id = (
                 self.config_vars.get("VERTEXAI_PROJECT")
@@ -189,14 +264,18 @@ class ConfigManager:
         provider_kwargs = {}
         
         # Get API key based on provider
+        provider_lower = provider.lower()
         if args.api_key:
             # Use API key from args
             api_key = args.api_key
-        elif provider.lower() == "anthropic":
-            api_key = self.config_vars.get("ANTHROPIC_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
-        elif provider.lower() == "vertexai":
-            api_key = self.config_vars.get("VERTEXAI_API_KEY") or os.environ.get("VERTEXAI_API_KEY")
-            
+        elif provider_lower in PROVIDER_API_KEY_VARS:
+            key_var = PROVIDER_API_KEY_VARS[provider_lower]
+            api_key = self.config_vars.get(key_var) or os.environ.get(key_var)
+        else:
+            # Fallback to generic API key or anthropic key for backward compatibility
+            api_key = self.api_key or os.environ.get("API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
+
+        if provider_lower == "vertexai" and not args.api_key:
             # Handle VertexAI project ID from config or environment
             project_id = (
                 self.config_vars.get("VERTEXAI_PROJECT")
@@ -222,13 +301,6 @@ class ConfigManager:
             else:
                 self.console.print("[bold red]ERROR: No location specified for VertexAI. Set VERTEXAI_LOCATION in config or environment.[/bold red]")
                 return provider, None, provider_kwargs
-        elif provider.lower() == "groq":
-            api_key = self.config_vars.get("GROQ_API_KEY") or os.environ.get("GROQ_API_KEY")
-        elif provider.lower() == "openai":
-            api_key = self.config_vars.get("OPENAI_API_KEY") or os.environ.get("OPENAI_API_KEY")
-        else:
-            # Fallback to generic API key or anthropic key for backward compatibility
-            api_key = self.api_key or os.environ.get("API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
             
         return provider, api_key, provider_kwargs
         
@@ -306,36 +378,40 @@ class ConfigManager:
             with open(CONFIG_PATH, "r") as f:
                 lines = f.readlines()
                 
-            # Process each line, updating PROVIDER and model settings
+            # Build the replacement lines once rather than per config line
+            provider_line = f"{PROVIDER_PREFIX}{provider}\n"
+            model_prefix = f"{provider.upper()}_MODEL="
+            model_line = f"{model_prefix}{model}\n" if model else None
+
+            # Process each line in a single pass, updating PROVIDER and model settings
             provider_updated = False
             model_updated = False
             updated_lines = []
             
             for line in lines:
-                stripped = line.strip()
+                stripped = line.lstrip()
                 
                 # Update provider line
-                if stripped.startswith("PROVIDER="):
-                    updated_lines.append(f"PROVIDER={provider}\n")
+                if stripped.startswith(PROVIDER_PREFIX):
+                    updated_lines.append(provider_line)
                     provider_updated = True
                 # Update model line for this provider
-                elif model and stripped.startswith(f"{provider.upper()}_MODEL="):
-                    updated_lines.append(f"{provider.upper()}_MODEL={model}\n")
+                elif model_line and stripped.startswith(model_prefix):
+                    updated_lines.append(model_line)
                     model_updated = True
                 else:
                     updated_lines.append(line)
                     
             # Add provider line if not found
             if not provider_updated:
-                updated_lines.append(f"PROVIDER={provider}\n")
+                updated_lines.append(provider_line)
                 
             # Add model line if not found and model provided
-            if model and not model_updated:
-                updated_lines.append(f"{provider.upper()}_MODEL={model}\n")
+            if model_line and not model_updated:
+                updated_lines.append(model_line)
                 
             # Write updated config
-            with open(CONFIG_PATH, "w") as f:
-                f.writelines(updated_lines)
+            _atomic_write_lines(CONFIG_PATH, updated_lines)
                 
             self.console.print(f"[green]Updated config file with provider: {provider}[/green]")
             if model:
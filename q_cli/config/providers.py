@@ -37,6 +37,32 @@ OPENAI_MAX_CONTEXT_TOKENS = 128000
 # Rate limiting
 RATE_LIMIT_COOLDOWN = 5  # seconds to wait after hitting rate limit
 
+# Per-provider lookup tables, keyed by lowercase provider name
+PROVIDER_DEFAULT_MODELS = {
+    "anthropic": ANTHROPIC_DEFAULT_MODEL,
+    "vertexai": VERTEXAI_DEFAULT_MODEL,
+    "groq": GROQ_DEFAULT_MODEL,
+    "openai": OPENAI_DEFAULT_MODEL,
+}
+PROVIDER_MAX_TOKENS = {
+    "anthropic": ANTHROPIC_MAX_TOKENS,
+    "vertexai": VERTEXAI_MAX_TOKENS,
+    "groq": GROQ_MAX_TOKENS,
+    "openai": OPENAI_MAX_TOKENS,
+}
+PROVIDER_MAX_TOKENS_PER_MIN = {
+    "anthropic": ANTHROPIC_MAX_TOKENS_PER_MIN,
+    "vertexai": VERTEXAI_MAX_TOKENS_PER_MIN,
+    "groq": GROQ_MAX_TOKENS_PER_MIN,
+    "openai": OPENAI_MAX_TOKENS_PER_MIN,
+}
+PROVIDER_MAX_CONTEXT_TOKENS = {
+    "anthropic": ANTHROPIC_MAX_CONTEXT_TOKENS,
+    "vertexai": VERTEXAI_MAX_CONTEXT_TOKENS,
+    "groq": GROQ_MAX_CONTEXT_TOKENS,
+    "openai": OPENAI_MAX_CONTEXT_TOKENS,
+}
+
 # Provider-specific ENV vars mapping
 PROVIDER_ENV_VARS = {
     "anthropic": {
@@ -63,6 +89,11 @@ PROVIDER_ENV_VARS = {
     },
 }
 
+# Config/env variable holding each provider's API key
+PROVIDER_API_KEY_VARS = {
+    provider: env_vars["api_key"][0] for provider, env_vars in PROVIDER_ENV_VARS.items()
+}
+
 # Model name validation patterns by provider
 PROVIDER_MODEL_PATTERNS = {
     "anthropic": ["claude", "anthropic"],
@@ -81,16 +112,7 @@ def get_default_model(provider: str) -> str:
     Returns:
         The default model for the provider
     """
-    provider = provider.lower()
-    if provider == "anthropic":
-        return ANTHROPIC_DEFAULT_MODEL
-    elif provider == "vertexai":
-        return VERTEXAI_DEFAULT_MODEL
-    elif provider == "groq":
-        return GROQ_DEFAULT_MODEL
-    elif provider == "openai":
-        return OPENAI_DEFAULT_MODEL
-    return ANTHROPIC_DEFAULT_MODEL
+    return PROVIDER_DEFAULT_MODELS.get(provider.lower(), ANTHROPIC_DEFAULT_MODEL)
 
 
 def get_max_tokens(provider: str) -> int:
@@ -102,16 +124,7 @@ def get_max_tokens(provider: str) -> int:
     Returns:
         The default max_tokens for the provider
     """
-    provider = provider.lower()
-    if provider == "anthropic":
-        return ANTHROPIC_MAX_TOKENS
-    elif provider == "vertexai":
-        return VERTEXAI_MAX_TOKENS
-    elif provider == "groq":
-        return GROQ_MAX_TOKENS
-    elif provider == "openai":
-        return OPENAI_MAX_TOKENS
-    return 8192  # Safe default
+    return PROVIDER_MAX_TOKENS.get(provider.lower(), 8192)  # Safe default
 
 
 def get_max_tokens_per_min(provider: str) -> int:
@@ -123,16 +136,8 @@ def get_max_tokens_per_min(provider: str) -> int:
     Returns:
         The rate limit in tokens per minute (0 means no limit)
     """
-    provider = provider.lower()
-    if provider == "anthropic":
-        return ANTHROPIC_MAX_TOKENS_PER_MIN
-    elif provider == "vertexai":
-        return VERTEXAI_MAX_TOKENS_PER_MIN
-    elif provider == "groq":
-        return GROQ_MAX_TOKENS_PER_MIN
-    elif provider == "openai":
-        return OPENAI_MAX_TOKENS_PER_MIN
-    return 0  # No rate limit by default
+    # No rate limit by default
+    return PROVIDER_MAX_TOKENS_PER_MIN.get(provider.lower(), 0)
 
 
 def get_max_context_tokens(provider: str) -> int:
@@ -144,16 +149,7 @@ def get_max_context_tokens(provider: str) -> int:
     Returns:
         The maximum context token limit
     """
-    provider = provider.lower()
-    if provider == "anthropic":
-        return ANTHROPIC_MAX_CONTEXT_TOKENS
-    elif provider == "vertexai":
-        return VERTEXAI_MAX_CONTEXT_TOKENS
-    elif provider == "groq":
-        return GROQ_MAX_CONTEXT_TOKENS
-    elif provider == "openai":
-        return OPENAI_MAX_CONTEXT_TOKENS
-    return 200000  # Safe default
+    return PROVIDER_MAX_CONTEXT_TOKENS.get(provider.lower(), 200000)  # Safe default
 
 
 def get_provider_env_vars(provider: str) -> Dict[str, List[str]]:
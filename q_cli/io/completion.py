@@ -0,0 +1,361 @@
+"""Path and slash command completion for the q_cli prompt."""
+
+import bisect
+import itertools
+import os
+import types
+from typing import Dict, Iterator, List, Tuple
+
+from prompt_toolkit.completion import Completer, Completion
+from prompt_toolkit.document import Document
+
+from q_cli.utils.constants import (
+    SAVE_COMMAND_PREFIX,
+    RECOVER_COMMAND,
+    TRANSPLANT_COMMAND
+)
+
+# Upper bound on directory listings kept by the path completer
+MAX_CACHED_COMPLETION_DIRS = 64
+
+# Upper bound on path completions offered for a single word
+MAX_PATH_COMPLETIONS = 200
+
+# Prefix after which /save completes a path
+_SAVE_COMMAND_WITH_SPACE = f"{SAVE_COMMAND_PREFIX} "
+
+# Home directory used to expand "~/" in path completions
+_USER_HOME = os.path.expanduser("~")
+
+
+# Completion descriptions for files, by lowercase extension (read-only)
+FILE_TYPE_DESCRIPTIONS = types.MappingProxyType({
+    **dict.fromkeys(
+        [".py", ".js", ".ts", ".tsx", ".jsx", ".java", ".c", ".cpp", ".go", ".rs"],
+        "Source code",
+    ),
+    **dict.fromkeys([".md", ".txt", ".rst", ".adoc"], "Text file"),
+    **dict.fromkeys([".json", ".yaml", ".yml", ".toml", ".ini", ".conf"], "Config file"),
+    **dict.fromkeys([".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"], "Image"),
+    **dict.fromkeys([".pdf", ".docx", ".xlsx", ".pptx"], "Document"),
+})
+
+
+def describe_file(name: str) -> str:
+    """
+    Describe a file for the completion menu based on its extension.
+
+    Args:
+        name: The file name
+
+    Returns:
+        A short description such as "Source code", or "File"
+    """
+    # Names are never paths here, so rfind replaces splitext; like splitext,
+    # a dot among the leading dots does not start an extension
+    dot = name.rfind(".")
+    if dot <= len(name) - len(name.lstrip(".")):
+        return "File"
+
+    # Extensions are usually lowercase already, so only lowercase on a miss
+    ext = name[dot:]
+    description = FILE_TYPE_DESCRIPTIONS.get(ext)
+    if description is None:
+        description = FILE_TYPE_DESCRIPTIONS.get(ext.lower(), "File")
+    return description
+
+
+def looks_like_path(word: str) -> bool:
+    """
+    Check whether a word typed into free text is worth path-completing.
+
+    Args:
+        word: The word under the cursor
+
+    Returns:
+        True for words with a directory part, a leading "~", or an extension
+    """
+    return "/" in word or word.startswith("~") or "." in word[1:]
+
+
+class SlashCommandCompleter(Completer):
+    """
+    Completer for slash commands.
+    """
+    
+    def __init__(self):
+        """Initialize the slash command completer."""
+        # Map commands to their help descriptions
+        self.commands = {
+            SAVE_COMMAND_PREFIX: "Save the last response to a file",
+            RECOVER_COMMAND: "Recover a previous session",
+            TRANSPLANT_COMMAND: "Change the active provider and model"
+        }
+        # Commands in the order they are offered, and the longest one, so
+        # text that can't be a command prefix is rejected without scanning
+        self._sorted_commands = sorted(self.commands.items())
+        self._sorted_names = [command for command, _ in self._sorted_commands]
+        self._max_command_length = max(map(len, self.commands))
+    
+    def get_completions(self, document, complete_event):
+        """
+        Get completions for the current document.
+        
+        Args:
+            document: The current document being edited
+            complete_event: The completion event
+            
+        Yields:
+            Completion objects
+        """
+        # Only provide completions at the start of the line
+        if not document.text.startswith('/'):
+            return
+            
+        # Get the text up to the cursor
+        text = document.text_before_cursor
+        if len(text) > self._max_command_length:
+            return
+        
+        # Commands sharing the typed prefix sit next to each other in sorted
+        # order, starting where the prefix itself would be inserted
+        start = bisect.bisect_left(self._sorted_names, text)
+        for command, description in itertools.islice(self._sorted_commands, start, None):
+            if not command.startswith(text):
+                break
+            # Return the remaining part of the command
+            yield Completion(
+                command[len(text):],
+                start_position=0,
+                display=command,
+                display_meta=description
+            )
+
+
+class CombinedCompleter(Completer):
+    """
+    Completer that combines slash command completion and path completion.
+    """
+    
+    def __init__(self):
+        """Initialize the combined completer."""
+        self.slash_completer = SlashCommandCompleter()
+        self.path_completer = SmartPathCompleter()
+    
+    def get_completions(self, document, complete_event):
+        """
+        Get completions from either slash commands or paths depending on context.
+        
+        Args:
+            document: The current document being edited
+            complete_event: The completion event
+            
+        Yields:
+            Completion objects
+        """
+        text = document.text_before_cursor
+        
+        # Special case for /save command - provide path completion
+        if text.startswith(_SAVE_COMMAND_WITH_SPACE):
+            # Get the part after "/save "
+            path_text = text[len(_SAVE_COMMAND_WITH_SPACE):]
+            # Create a new document with just the path part
+            path_document = Document(path_text, cursor_position=len(path_text))
+            # Use path completer for this part. Its start positions are relative
+            # to the cursor, so they already line up with the full input
+            for completion in self.path_completer.get_completions(path_document, complete_event):
+                # Describe where the response will be saved
+                if completion.display_meta_text == "Directory":
+                    display_meta = "Save to this directory"
+                else:
+                    display_meta = "Save to this file"
+
+                yield Completion(
+                    completion.text,
+                    start_position=completion.start_position,
+                    display_meta=display_meta,
+                )
+        # If the input starts with a slash but is not complete yet, use slash command completer
+        elif text.startswith('/'):
+            for completion in self.slash_completer.get_completions(document, complete_event):
+                yield completion
+        # For all other text, use the smart path completer, but only once the
+        # word looks like a path; most words typed into a chat prompt aren't
+        # paths, and listing the directory for them is wasted work
+        else:
+            word, _ = self.path_completer.get_word_under_cursor(document)
+            if not looks_like_path(word):
+                return
+            for completion in self.path_completer.get_completions(document, complete_event):
+                yield completion
+
+
+class SmartPathCompleter(Completer):
+    """
+    Path completer that works anywhere in the input text.
+
+    This completer scans the text at the current cursor position to find any
+    partial path or filename, then offers completions for it.
+    """
+
+    def __init__(self):
+        """Initialize the smart path completer."""
+        # Directory listings as (name, is_dir, display_meta) entries, keyed by
+        # the directory as typed and validated against its (device, inode, mtime)
+        self._dir_cache: Dict[str, Tuple[Tuple[int, int, int], List[Tuple[str, bool, str]]]] = {}
+
+    def _list_directory(self, directory: str) -> List[Tuple[str, bool, str]]:
+        """
+        List a directory, reusing the previous listing while it's unchanged.
+
+        Completion runs on every keystroke, so a single stat replaces the
+        directory read and the per-entry isdir calls when nothing changed.
+
+        Args:
+            directory: The directory to list
+
+        Returns:
+            List of (name, is_dir, display_meta) tuples
+        """
+        st = os.stat(directory)
+        signature = (st.st_dev, st.st_ino, st.st_mtime_ns)
+        cached = self._dir_cache.get(directory)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        # scandir answers is_dir from the directory read in most cases, and
+        # each entry is described once per listing rather than per keystroke
+        entries = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir():
+                    entries.append((entry.name, True, "Directory"))
+                else:
+                    entries.append((entry.name, False, describe_file(entry.name)))
+
+        if len(self._dir_cache) >= MAX_CACHED_COMPLETION_DIRS:
+            self._dir_cache.clear()
+        self._dir_cache[directory] = (signature, entries)
+        return entries
+
+    def get_word_under_cursor(self, document: Document) -> Tuple[str, int]:
+        """
+        Get the word under cursor and its start position.
+
+        Args:
+            document: The document being edited
+
+        Returns:
+            Tuple containing (word, start_position)
+        """
+        # A word never spans a newline, so only the current line up to the
+        # cursor needs to be searched, however long the whole input is
+        text_before_cursor = document.current_line_before_cursor
+
+        # Find potential path fragments that could be completed: the run of
+        # non-whitespace ending at the cursor. rsplit scans from the right,
+        # so only that last word is examined
+        if not text_before_cursor or text_before_cursor[-1].isspace():
+            return "", document.cursor_position
+
+        word = text_before_cursor.rsplit(None, 1)[-1]
+        return word, document.cursor_position - len(word)
+
+    def get_path_completions(self, current_word: str) -> Iterator[Tuple[str, str]]:
+        """
+        Get possible path completions for the current word.
+
+        Completions are yielded as they are found, so callers can stop early
+        on large directories.
+
+        Args:
+            current_word: The word to complete
+
+        Yields:
+            (completion, display_meta) tuples
+        """
+        # Words without a directory component complete from the current
+        # directory, with completions shown as bare names
+        if "/" not in current_word:
+            yield from self._match_entries(".", current_word, "")
+            return
+
+        # Get the directory part and the filename part
+        directory, filename = os.path.split(current_word)
+
+        # Handle special case for current directory
+        if directory == "":
+            directory = "."
+
+        # Expand user home if needed; the common "~/" form uses the home
+        # directory resolved at import instead of a lookup per keystroke
+        if directory == "~" or directory.startswith("~/"):
+            directory = _USER_HOME + directory[1:]
+        elif directory.startswith("~"):
+            directory = os.path.expanduser(directory)
+
+        # Build the directory prefix once; each match then only needs a
+        # concat. os.path.split only leaves a trailing slash on the root
+        path_prefix = directory if directory.endswith("/") else f"{directory}/"
+        yield from self._match_entries(directory, filename, path_prefix)
+
+    def _match_entries(
+        self, directory: str, filename: str, path_prefix: str
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Yield the entries of a directory that start with a filename prefix.
+
+        Args:
+            directory: The directory to list
+            filename: The typed prefix of the entry name
+            path_prefix: Text prepended to each entry name in the completion
+
+        Yields:
+            (completion, display_meta) tuples
+        """
+        # Any OSError (missing, not a directory, name too long, symlink
+        # loop...) just means there is nothing to complete
+        try:
+            entries = self._list_directory(directory)
+        except OSError:
+            return
+
+        # Filter the directory listing by prefix; like the shell, hidden
+        # entries are only offered once the user types the leading dot
+        for name, is_dir, display_meta in entries:
+            if not name.startswith(filename):
+                continue
+            if not filename and name.startswith("."):
+                continue
+
+            if is_dir:
+                # Add trailing slash for directories
+                yield f"{path_prefix}{name}/", display_meta
+            else:
+                yield path_prefix + name, display_meta
+
+    def get_completions(self, document, complete_event):
+        """
+        Get completions for the current document.
+
+        Args:
+            document: The current document being edited
+            complete_event: The completion event
+
+        Yields:
+            Completion objects
+        """
+        # Get the word under cursor and its position
+        word, word_start = self.get_word_under_cursor(document)
+
+        # Calculate the correct start position
+        start_position = word_start - document.cursor_position
+
+        # Convert to Completion objects as they are found, stopping at what
+        # the completion menu can usefully show
+        for text, display_meta in itertools.islice(
+            self.get_path_completions(word), MAX_PATH_COMPLETIONS
+        ):
+            yield Completion(
+                text, start_position=start_position, display_meta=display_meta
+            )
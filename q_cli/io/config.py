@@ -1,30 +1,64 @@
 """Configuration file handling for q_cli."""
 
+import functools
+import operator
 import os
+import re
+import stat
 import sys
-import subprocess
-from typing import Dict, Optional, Tuple, List
-
-from rich.console import Console
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, List
 
 from q_cli.utils.constants import (
     CONFIG_PATH,
-    REDACTED_TEXT,
     get_debug,
     INCLUDE_FILE_TREE,
     MAX_FILE_TREE_ENTRIES,
+    MAX_CONTEXT_FILE_SIZE,
     DEFAULT_MAX_CONTEXT_TOKENS,
     DEFAULT_CONTEXT_PRIORITY_MODE,
     ESSENTIAL_PRIORITY,
     IMPORTANT_PRIORITY,
     SUPPLEMENTARY_PRIORITY,
 )
-from q_cli.utils.helpers import contains_sensitive_info, expand_env_vars
-from q_cli.utils.context import ContextManager
-from q_cli.config.manager import ConfigManager
+from q_cli.utils.helpers import redact_sensitive_bytes
+from q_cli.config.manager import ConfigManager, strip_inline_comment
+from q_cli.config.providers import DEFAULT_PROVIDER, get_max_context_tokens
+
+if TYPE_CHECKING:
+    # Only needed for annotations; rich and the context manager are imported
+    # lazily so the common startup path doesn't pay for them
+    from rich.console import Console
+    from q_cli.utils.context import ContextManager
+
+# Context files larger than this are read through mmap with readahead hints
+MMAP_READ_THRESHOLD = 64 * 1024
+
+# Carriage-return line endings, normalized to "\n" as text mode would
+_NEWLINE_RE = re.compile(rb"\r\n?")
+
+# Skip generating the file tree when fewer important tokens than this remain
+MIN_FILE_TREE_BUDGET = 200
+
+# Upper bound on threads used to read multiple --context-file arguments
+MAX_CONTEXT_FILE_WORKERS = 8
+
+# File tree settings shared by the 'tree' command and the in-process fallback
+FILE_TREE_MAX_DEPTH = 3
+FILE_TREE_EXCLUDES = frozenset(
+    {
+        "node_modules",
+        "venv",
+        "__pycache__",
+        ".git",
+        ".idea",
+        ".vscode",
+        "dist",
+        "build",
+    }
+)
 
 
-def validate_config(config_vars: Dict[str, str], console: Console) -> None:
+def validate_config(config_vars: Dict[str, str], console: "Console") -> None:
     """
     Validate configuration variables for consistency and correctness.
     
@@ -43,7 +77,7 @@ def validate_config(config_vars: Dict[str, str], console: Console) -> None:
         raise ValueError("Configuration validation failed")
 
 
-def read_config_file(console: Console) -> Tuple[Optional[str], str, Dict[str, str]]:
+def read_config_file(console: "Console") -> Tuple[Optional[str], str, Dict[str, str]]:
     """
     Read the configuration file for API key and context.
 
@@ -58,29 +92,123 @@ def read_config_file(console: Console) -> Tuple[Optional[str], str, Dict[str, st
     return config_manager.load_config()
 
 
-def read_context_file(file_path: str, console: Console) -> str:
+def _decode_redacted(data: bytes) -> str:
+    """
+    Normalize newlines, redact sensitive lines and decode raw file content.
+
+    Args:
+        data: Raw file content (bytes or mmap)
+
+    Returns:
+        The redacted content decoded as UTF-8
+    """
+    # Match the universal-newlines behaviour of text mode in a single pass
+    # over the buffer, rather than copying it once per replacement
+    if data.find(b"\r") != -1:
+        data = _NEWLINE_RE.sub(b"\n", data)
+
+    # Decode once at the end; clean content is decoded straight from the buffer
+    return str(redact_sensitive_bytes(data), "utf-8")
+
+
+def _read_redacted_text(file_path: str, size: int) -> str:
+    """
+    Read a text file with sensitive lines redacted.
+
+    Content is scanned as bytes; large files are scanned directly in an mmap
+    with sequential readahead, so no intermediate copy is made.
+
+    Args:
+        file_path: Path to the file to read
+        size: Size of the file in bytes, from the caller's stat
+
+    Returns:
+        The redacted content, with newlines normalized as in text mode
+    """
+    with open(file_path, "rb") as f:
+        if size <= MMAP_READ_THRESHOLD:
+            return _decode_redacted(f.read())
+
+        import mmap
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Let the kernel read ahead aggressively; madvise is not
+            # available on every platform
+            if hasattr(mm, "madvise"):
+                for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+                    if hasattr(mmap, advice):
+                        mm.madvise(getattr(mmap, advice))
+            return _decode_redacted(mm)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_redacted_text_cached(file_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Read a file with _read_redacted_text, cached on its path, mtime and size.
+
+    Only used for .Q/project.md, which is re-read on every turn; callers pass
+    an absolute path so each file has a single entry.
+    """
+    return _read_redacted_text(file_path, size)
+
+
+@functools.lru_cache(maxsize=4)
+def _scan_q_dir_cached(
+    q_dir_path: str, mtime_ns: int
+) -> Tuple[Tuple[str, ...], Optional[str]]:
+    """
+    List a .Q directory, cached on its path and mtime.
+
+    Args:
+        q_dir_path: Path to the .Q directory
+        mtime_ns: Modification time of the directory in nanoseconds
+
+    Returns:
+        Tuple containing:
+        - The sorted entry names
+        - The path to project.md if it is a file, otherwise None
+    """
+    q_files = []
+    project_md_path = None
+    with os.scandir(q_dir_path) as entries:
+        for entry in entries:
+            q_files.append(entry.name)
+            if entry.name == "project.md" and entry.is_file():
+                project_md_path = entry.path
+    q_files.sort()
+    return tuple(q_files), project_md_path
+
+
+def read_context_file(file_path: str, console: "Console", cache: bool = False) -> str:
     """
     Read a context file and return its contents, ensuring no API keys are included.
 
+    Files larger than MAX_CONTEXT_FILE_SIZE are skipped with a warning.
+
     Args:
         file_path: Path to the context file to read
         console: Console instance for output
+        cache: Reuse the contents across calls until the file's mtime or size
+            changes
 
     Returns:
         The sanitized content of the file as a string
     """
     try:
-        with open(file_path, "r") as f:
-            content = f.read()
-            # Filter out potential API keys (simple pattern matching)
-            filtered_lines = []
-            for line in content.split("\n"):
-                # Skip lines that look like API keys
-                if contains_sensitive_info(line):
-                    filtered_lines.append(REDACTED_TEXT)
-                else:
-                    filtered_lines.append(line)
-            return "\n".join(filtered_lines)
+        # Redact lines that look like API keys in one scan over the content
+        st = os.stat(file_path)
+        if st.st_size > MAX_CONTEXT_FILE_SIZE:
+            console.print(
+                f"Warning: Skipping context file {file_path}: larger than "
+                f"{MAX_CONTEXT_FILE_SIZE // (1024 * 1024)} MB",
+                style="warning",
+            )
+            return ""
+        if cache:
+            return _read_redacted_text_cached(
+                os.path.abspath(file_path), st.st_mtime_ns, st.st_size
+            )
+        return _read_redacted_text(file_path, st.st_size)
     except Exception as e:
         console.print(
             f"Warning: Error reading context file {file_path}: {e}", style="warning"
@@ -88,7 +216,7 @@ def read_context_file(file_path: str, console: Console) -> str:
         return ""
 
 
-def update_config_provider(new_provider: str, console: Console, model: str = None) -> bool:
+def update_config_provider(new_provider: str, console: "Console", model: str = None) -> bool:
     """
     Update the configuration file with a new provider and optionally a new model.
     
@@ -105,9 +233,27 @@ def update_config_provider(new_provider: str, console: Console, model: str = Non
     return config_manager.update_config_provider(new_provider, model)
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_max_context_tokens(provider: str, configured: Optional[str]) -> int:
+    """
+    Resolve the context token limit for a provider, cached per config value.
+
+    Args:
+        provider: The provider name
+        configured: The <PROVIDER>_MAX_CONTEXT_TOKENS config value, if set
+
+    Returns:
+        The configured limit with any inline comment removed, or the
+        provider's default
+    """
+    if configured is None:
+        return get_max_context_tokens(provider)
+    return int(strip_inline_comment(configured))
+
+
 def build_context(
-    args, config_context: str, console: Console, config_vars: Dict[str, str] = None
-) -> Tuple[str, ContextManager]:
+    args, config_context: str, console: "Console", config_vars: Dict[str, str] = None
+) -> Tuple[str, "ContextManager"]:
     """
     Build the context from config and additional context files using priority-based management.
 
@@ -122,12 +268,11 @@ def build_context(
         - Combined context string
         - ContextManager instance
     """
-    # Import provider-specific constants
-    from q_cli.config.providers import (
-        DEFAULT_PROVIDER,
-        get_max_context_tokens
-    )
-    
+    from q_cli.utils.context import ContextManager
+
+    # Evaluate debug mode once for the whole build
+    debug = get_debug()
+
     # Initialize with empty dict if not provided
     config_vars = config_vars or {}
     
@@ -143,17 +288,10 @@ def build_context(
         # User explicitly specified value, use it
         pass
     else:
-        # Get provider-specific token limit
-        max_tokens = get_max_context_tokens(provider)
-        
-        # Check if there's a config override
-        provider_key = f"{provider.upper()}_MAX_CONTEXT_TOKENS"
-        if provider_key in config_vars:
-            config_value = config_vars[provider_key]
-            # Remove inline comments if present
-            if "#" in config_value:
-                config_value = config_value.split("#")[0].strip()
-            max_tokens = int(config_value)
+        # Get provider-specific token limit or the config override
+        max_tokens = _resolve_max_context_tokens(
+            provider, config_vars.get(f"{provider.upper()}_MAX_CONTEXT_TOKENS")
+        )
     
     priority_mode = getattr(
         args, "context_priority_mode", DEFAULT_CONTEXT_PRIORITY_MODE
@@ -169,19 +307,63 @@ def build_context(
             config_context, SUPPLEMENTARY_PRIORITY, "Config file context"
         )
 
+    # List the .Q directory in the current working directory, noting
+    # project.md from the same scan; the listing is reused until .Q changes
+    q_dir_path = os.path.join(os.getcwd(), ".Q")
+    q_files = ()
+    project_md_path = None
+    try:
+        q_dir_stat = os.stat(q_dir_path)
+    except OSError:
+        q_dir_stat = None
+    if q_dir_stat is not None and stat.S_ISDIR(q_dir_stat.st_mode):
+        try:
+            q_files, project_md_path = _scan_q_dir_cached(
+                q_dir_path, q_dir_stat.st_mtime_ns
+            )
+        except Exception as e:
+            if debug:
+                console.print(f"[yellow]Error reading .Q directory: {str(e)}[/yellow]")
+
+    # Read the context files and project.md concurrently, but add them on
+    # this thread in priority order so the context stays deterministic
+    read_paths = list(args.context_file or [])
+    if project_md_path:
+        read_paths.append(project_md_path)
+
+    # Only project.md is cached; it is re-read on every turn, while caching
+    # every --context-file body would keep them all in memory
+    def read_path(path: str) -> str:
+        return read_context_file(path, console, cache=path == project_md_path)
+
+    if len(read_paths) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONTEXT_FILE_WORKERS, len(read_paths))
+        ) as executor:
+            file_contents = list(executor.map(read_path, read_paths))
+    else:
+        file_contents = [read_path(path) for path in read_paths]
+
+    project_content = file_contents.pop() if project_md_path else ""
+
     # Add context from additional files (important priority)
-    if args.context_file:
-        for file_path in args.context_file:
-            file_content = read_context_file(file_path, console)
-            if file_content:
-                context_manager.add_context(
-                    f"Content from {os.path.basename(file_path)}:\n{file_content}",
-                    IMPORTANT_PRIORITY,
-                    f"File context: {os.path.basename(file_path)}",
-                )
+    for file_path, file_content in zip(read_paths, file_contents):
+        if file_content:
+            file_name = os.path.basename(file_path)
+            context_manager.add_context(
+                f"Content from {file_name}:\n{file_content}",
+                IMPORTANT_PRIORITY,
+                f"File context: {file_name}",
+            )
 
-    # Add the current directory file tree to the context if enabled (important priority)
-    if INCLUDE_FILE_TREE:
+    # Add the current directory file tree to the context if enabled (important
+    # priority), unless the important budget is already too full to keep it
+    if (
+        INCLUDE_FILE_TREE
+        and context_manager.remaining_budget(IMPORTANT_PRIORITY) > MIN_FILE_TREE_BUDGET
+    ):
         file_tree = generate_file_tree(console)
         if file_tree:
             context_manager.add_context(
@@ -190,46 +372,31 @@ def build_context(
                 "File tree",
             )
 
-            if get_debug():
+            if debug:
                 console.print("[info]Added file tree to context[/info]")
 
-    # Check for .Q directory in current working directory
-    q_dir_path = os.path.join(os.getcwd(), ".Q")
-    if os.path.isdir(q_dir_path):
-        # Get all files in .Q directory
-        try:
-            q_files = os.listdir(q_dir_path)
-            if q_files:
-                file_list = "\n".join([f"- {file}" for file in q_files])
-                context_manager.add_context(
-                    f"Project .Q directory contents:\n{file_list}",
-                    IMPORTANT_PRIORITY,
-                    ".Q directory files",
-                )
-                if get_debug():
-                    console.print(
-                        f"[info]Added {len(q_files)} files from .Q directory to context[/info]"
-                    )
-        except Exception as e:
-            if get_debug():
-                console.print(f"[yellow]Error reading .Q directory: {str(e)}[/yellow]")
+    # Add the .Q directory listing
+    if q_files:
+        file_list = "\n".join(f"- {file}" for file in q_files)
+        context_manager.add_context(
+            f"Project .Q directory contents:\n{file_list}",
+            IMPORTANT_PRIORITY,
+            ".Q directory files",
+        )
+        if debug:
+            console.print(
+                f"[info]Added {len(q_files)} files from .Q directory to context[/info]"
+            )
 
-    # Check for project.md file inside the .Q directory
-    project_md_path = os.path.join(q_dir_path, "project.md")
-    if os.path.isdir(q_dir_path) and os.path.isfile(project_md_path):
-        try:
-            project_content = read_context_file(project_md_path, console)
-            if project_content:
-                context_manager.add_context(
-                    f"Project Information:\n{project_content}",
-                    IMPORTANT_PRIORITY,
-                    "project.md content",
-                )
-                if get_debug():
-                    console.print("[info]Added .Q/project.md content to context[/info]")
-        except Exception as e:
-            if get_debug():
-                console.print(f"[yellow]Error reading .Q/project.md: {str(e)}[/yellow]")
+    # Add the project.md file from inside the .Q directory
+    if project_content:
+        context_manager.add_context(
+            f"Project Information:\n{project_content}",
+            IMPORTANT_PRIORITY,
+            "project.md content",
+        )
+        if debug:
+            console.print("[info]Added .Q/project.md content to context[/info]")
 
     # Build the final context string
     context = context_manager.build_context_string()
@@ -239,188 +406,218 @@ def build_context(
         tokens_by_priority = context_manager.get_tokens_by_priority()
         total_tokens = context_manager.get_total_tokens()
 
-        console.print("\n[bold]Context Statistics:[/bold]")
-        console.print(f"Total context tokens: {total_tokens}/{max_tokens}")
-        console.print(f"System prompt: {tokens_by_priority['system']} tokens")
-        console.print(
-            f"Essential context: {tokens_by_priority[ESSENTIAL_PRIORITY]} tokens"
-        )
-        console.print(
-            f"Important context: {tokens_by_priority[IMPORTANT_PRIORITY]} tokens"
-        )
-        console.print(
-            f"Supplementary context: {tokens_by_priority[SUPPLEMENTARY_PRIORITY]} tokens"
-        )
-        console.print("")
+        # Emit the whole block with a single print
+        stats_lines = [
+            "\n[bold]Context Statistics:[/bold]",
+            f"Total context tokens: {total_tokens}/{max_tokens}",
+            f"System prompt: {tokens_by_priority['system']} tokens",
+            f"Essential context: {tokens_by_priority[ESSENTIAL_PRIORITY]} tokens",
+            f"Important context: {tokens_by_priority[IMPORTANT_PRIORITY]} tokens",
+            f"Supplementary context: {tokens_by_priority[SUPPLEMENTARY_PRIORITY]} tokens",
+            "",
+        ]
+        console.print("\n".join(stats_lines))
 
     return context, context_manager
 
 
-def generate_file_tree(console: Console) -> str:
+@functools.lru_cache(maxsize=None)
+def _find_tree_command() -> Optional[str]:
+    """Resolve the 'tree' binary on PATH once per process, or None if absent."""
+    import shutil
+
+    return shutil.which("tree")
+
+
+def _list_tree_entries(path: str) -> List[os.DirEntry]:
     """
-    Generate a tree view of the current directory.
+    List the visible entries of a directory, sorted by name.
+
+    Hidden entries and FILE_TREE_EXCLUDES are skipped.
+
+    Args:
+        path: Directory to list
 
     Returns:
-        A string representation of the directory tree
+        Sorted list of directory entries, empty if the directory can't be read
     """
     try:
-        # Check if 'tree' command is available
-        try:
-            # Try using the tree command first for better formatting
-            # Exclude common directories to avoid clutter
-            tree_cmd = [
-                "tree",
-                "-L",
-                "3",
-                "--noreport",
-                "-I",
-                "node_modules|venv|__pycache__|.git|.idea|.vscode|dist|build",
+        with os.scandir(path) as it:
+            entries = [
+                entry
+                for entry in it
+                if not entry.name.startswith(".")
+                and entry.name not in FILE_TREE_EXCLUDES
             ]
+    except OSError:
+        return []
 
-            result = subprocess.run(
-                tree_cmd, capture_output=True, text=True, check=False
-            )
+    entries.sort(key=operator.attrgetter("name"))
+    return entries
+
+
+def _walk_tree_lines(
+    root: str = ".",
+    max_depth: int = FILE_TREE_MAX_DEPTH,
+    max_entries: int = MAX_FILE_TREE_ENTRIES,
+) -> Tuple[List[str], int]:
+    """
+    Walk a directory in-process and emit tree-drawing lines directly.
 
-            if result.returncode == 0 and result.stdout.strip():
-                tree_output = result.stdout.strip()
-                if get_debug():
-                    console.print(
-                        f"[info]Generated file tree using 'tree' command[/info]"
-                    )
-                return tree_output
-        except FileNotFoundError:
-            # Tree command not available, we'll use the fallback method
-            if get_debug():
-                console.print(
-                    "[yellow]'tree' command not found, using fallback method[/yellow]"
+    Uses an explicit stack and scandir's cached entry types, so no
+    subprocess, intermediate dict or recursion is needed. The walk stops as
+    soon as max_entries lines have been emitted, so large trees cost no
+    more than small ones.
+
+    Args:
+        root: Directory to walk
+        max_depth: Maximum depth to descend, matching 'tree -L'
+        max_entries: Maximum number of lines to emit, including the root
+
+    Returns:
+        Tuple containing:
+        - List of lines, starting with the "." root
+        - Number of already-listed entries left out because of max_entries.
+          Their subdirectories are never read, so this is a lower bound.
+    """
+    lines = ["."]
+    # Each frame is [entries, next index, prefix, depth]
+    stack = [[_list_tree_entries(root), 0, "", 1]]
+    while stack:
+        frame = stack[-1]
+        entries, index, prefix, depth = frame
+        if index >= len(entries):
+            stack.pop()
+            continue
+        if len(lines) >= max_entries:
+            return lines, sum(len(f[0]) - f[1] for f in stack)
+        frame[1] = index + 1
+
+        entry = entries[index]
+        is_last_item = index == len(entries) - 1
+        if prefix:
+            lines.append(f"{prefix}{'└─ ' if is_last_item else '├─ '}{entry.name}")
+        else:
+            lines.append(entry.name)
+
+        # Descend into subdirectories with proper indentation
+        if depth < max_depth and entry.is_dir(follow_symlinks=False):
+            children = _list_tree_entries(entry.path)
+            if children:
+                stack.append(
+                    [children, 0, f"{prefix}{'   ' if is_last_item else '│  '}", depth + 1]
                 )
-            pass
-
-        # Fallback to find command
-        cmd = [
-            "find",
-            ".",
-            "-type",
-            "d",
-            "-o",
-            "-type",
-            "f",
-            "-not",
-            "-path",
-            "*/\\.*",
-            "-not",
-            "-path",
-            "*/venv/*",
-            "-not",
-            "-path",
-            "*/node_modules/*",
-            "-not",
-            "-path",
-            "*/__pycache__/*",
-            "-not",
-            "-path",
-            "*/dist/*",
-            "-not",
-            "-path",
-            "*/build/*",
-            "-maxdepth",
-            "3",
+
+    return lines, 0
+
+
+@functools.lru_cache(maxsize=8)
+def _generate_file_tree_cached(
+    cwd: str, mtime_ns: int, use_tree_command: bool = False
+) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Generate the file tree for a directory, cached on its path and mtime.
+
+    The cache key is (cwd, mtime_ns, use_tree_command), so adding or removing
+    entries directly in cwd regenerates the tree. Changes inside
+    subdirectories don't touch cwd's mtime and are not detected; use
+    clear_file_tree_cache() to force a rebuild.
+
+    Args:
+        cwd: Directory to generate the tree for
+        mtime_ns: Modification time of the directory in nanoseconds
+        use_tree_command: Render with the external 'tree' binary if present
+
+    Returns:
+        Tuple containing:
+        - The tree text
+        - Debug messages describing how the tree was built
+    """
+    messages = []
+
+    # The external tree command is opt-in; the in-process walk is faster
+    tree_bin = _find_tree_command() if use_tree_command else None
+    if tree_bin:
+        import subprocess
+
+        # Exclude common directories to avoid clutter; run the resolved path
+        # so the exec doesn't search PATH again
+        tree_cmd = [
+            tree_bin,
+            "-L",
+            str(FILE_TREE_MAX_DEPTH),
+            "--noreport",
+            "-I",
+            "|".join(FILE_TREE_EXCLUDES),
         ]
 
-        # Execute the find command
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        # Keep stdout as bytes and decode the stripped output once; file
+        # names that aren't valid UTF-8 are replaced rather than failing
+        result = subprocess.run(tree_cmd, capture_output=True, check=False, cwd=cwd)
+        tree_output = result.stdout.strip()
+
+        if result.returncode == 0 and tree_output:
+            messages.append("[info]Generated file tree using 'tree' command[/info]")
+            return tree_output.decode("utf-8", "replace"), tuple(messages)
+    elif use_tree_command:
+        # Tree command not available, we'll use the fallback method
+        messages.append(
+            "[yellow]'tree' command not found, using fallback method[/yellow]"
+        )
 
-        if result.returncode != 0:
-            if get_debug():
-                console.print(
-                    f"[yellow]Error generating file tree: {result.stderr}[/yellow]"
-                )
-            return ""
+    # Walk the directory in-process, stopping at the entry limit
+    tree_lines, omitted = _walk_tree_lines(cwd)
 
-        # Process the output to create a more visually appealing tree
-        lines = result.stdout.strip().split("\n")
-
-        # Build a tree structure
-        tree: dict[str, dict] = {}
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Remove leading ./
-            if line.startswith("./"):
-                line = line[2:]
-            elif line == ".":
-                continue
-
-            parts = line.split("/")
-            current = tree
-            for part in parts[:-1]:  # Process directories
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
-
-            # Add the leaf (file or directory)
-            leaf = parts[-1]
-            if leaf:  # Skip empty names
-                current[leaf] = {}
-
-        # Convert the tree structure to text
-        lines = []
-
-        def _build_tree_text(node, prefix="", is_last=True, lines_list=None):
-            if lines_list is None:
-                lines_list = []
-
-            items = list(node.items())
-            if not items:
-                return lines_list
-
-            for i, (name, children) in enumerate(items):
-                is_last_item = i == len(items) - 1
-
-                # Add the current line
-                if prefix:
-                    line = f"{prefix}{'└─ ' if is_last_item else '├─ '}{name}"
-                else:
-                    line = name
-                lines_list.append(line)
-
-                # Process children with proper indentation
-                if children:
-                    new_prefix = f"{prefix}{'   ' if is_last_item else '│  '}"
-                    _build_tree_text(children, new_prefix, is_last_item, lines_list)
-
-            return lines_list
-
-        # Generate the tree text
-        tree_lines = _build_tree_text(tree)
-        tree_lines.insert(0, ".")  # Add root
-
-        # Limit the number of entries if needed
-        if len(tree_lines) > MAX_FILE_TREE_ENTRIES:
-            if get_debug():
-                console.print(
-                    f"[yellow]Limiting file tree from {len(tree_lines)} to {MAX_FILE_TREE_ENTRIES} entries[/yellow]"
-                )
-            truncated_lines = tree_lines[:MAX_FILE_TREE_ENTRIES]
-            truncated_lines.append(
-                f"... ({len(tree_lines) - MAX_FILE_TREE_ENTRIES} more entries omitted)"
-            )
-            tree_lines = truncated_lines
+    if omitted:
+        messages.append(
+            f"[yellow]Limiting file tree to {MAX_FILE_TREE_ENTRIES} entries[/yellow]"
+        )
+        tree_lines.append(f"... (truncated: at least {omitted} more entries not shown)")
 
-        tree_text = "\n".join(tree_lines)
+    messages.append(f"[info]Generated file tree with {len(tree_lines)} entries[/info]")
 
-        if get_debug():
-            console.print(
-                f"[info]Generated file tree with {len(tree_lines)} entries[/info]"
-            )
+    return "\n".join(tree_lines), tuple(messages)
+
+
+def generate_file_tree(console: "Console") -> str:
+    """
+    Generate a tree view of the current directory.
+
+    Repeated calls reuse the cached tree until the directory's mtime changes.
+    Set Q_USE_TREE_COMMAND=1 to render with the external 'tree' command.
+
+    Returns:
+        A string representation of the directory tree
+    """
+    debug = get_debug()
+    try:
+        cwd = os.getcwd()
+        misses = _generate_file_tree_cached.cache_info().misses
+        tree_text, messages = _generate_file_tree_cached(
+            cwd,
+            os.stat(cwd).st_mtime_ns,
+            os.environ.get("Q_USE_TREE_COMMAND", "0") == "1",
+        )
+
+        if debug:
+            # The build messages describe a fresh generation, so only repeat
+            # them when this call actually built the tree
+            if _generate_file_tree_cached.cache_info().misses != misses:
+                for message in messages:
+                    console.print(message)
+            else:
+                console.print("[info]Reusing cached file tree[/info]")
 
         return tree_text
 
     except Exception as e:
-        if get_debug():
+        if debug:
             console.print(
                 f"[yellow]Error generating file tree: {str(e)}[/yellow]"
             )
-        return ""
\ No newline at end of file
+        return ""
+
+
+def clear_file_tree_cache() -> None:
+    """Drop cached file trees so the next call regenerates them."""
+    _generate_file_tree_cached.cache_clear()
@@ -35,12 +35,13 @@ def save_response_to_file(response: str, file_path: str, console: Console) -> bo
         True if successfully saved, False otherwise
     """
     try:
-        # Ensure the directory exists
+        # Ensure the directory exists; exist_ok avoids a separate exists()
+        # check and the race between it and makedirs
         directory = os.path.dirname(file_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
 
-        # Write the response to the file
+        # Write the response to the file in a single write call
         with open(file_path, "w") as f:
             f.write(response)
         return True
@@ -47,6 +47,13 @@ class LLMClient:
         
         # Format model name according to provider conventions
         self.model = self.provider_config.format_model_name(self.model)
+
+        # Provider error messages by the text that identifies them; the mapping
+        # is static, so build it once rather than on every failed request
+        self._error_messages = tuple(
+            (error_key, handler["message"])
+            for error_key, handler in self.provider_config.get_error_handler().items()
+        )
         
         # Initialize litellm
         self.client = litellm
@@ -165,17 +172,12 @@ class LLMClient:
             return self._transform_response(response, stream=stream)
             
         except litellm.exceptions.BadRequestError as e:
+            error_text = str(e)
             if get_debug():
-                print(f"LiteLLM bad request error: {str(e)}")
+                print(f"LiteLLM bad request error: {error_text}")
             
-            # Use provider-specific error handling
-            error_handlers = self.provider_config.get_error_handler()
-            for error_key, handler in error_handlers.items():
-                if error_key in str(e):
-                    error_msg = f"{handler['message']}\n\nOriginal error: {str(e)}"
-                    raise Exception(error_msg)
-                    
-            # If no specific handler, re-raise the original exception
+            # Use provider-specific error handling, or re-raise the original
+            self._raise_provider_error(error_text)
             raise e
             
         except litellm.exceptions.RateLimitError as e:
@@ -184,19 +186,16 @@ class LLMClient:
             raise e
             
         except litellm.exceptions.AuthenticationError as e:
+            error_text = str(e)
             if get_debug():
-                print(f"LiteLLM authentication error: {str(e)}")
+                print(f"LiteLLM authentication error: {error_text}")
             
             # Use provider-specific error handling
-            error_handlers = self.provider_config.get_error_handler()
-            for error_key, handler in error_handlers.items():
-                if error_key in str(e):
-                    error_msg = f"{handler['message']}\n\nOriginal error: {str(e)}"
-                    raise Exception(error_msg)
+            self._raise_provider_error(error_text)
                     
             # Default authentication error message
             error_msg = f"Authentication error with {self.provider}. Please check your API key and credentials."
-            raise Exception(f"{error_msg}\n\nOriginal error: {str(e)}")
+            raise Exception(f"{error_msg}\n\nOriginal error: {error_text}")
             
         except litellm.exceptions.APIError as e:
             if get_debug():
@@ -210,26 +209,36 @@ class LLMClient:
             
         # Generic exception handler for all other cases including ContentFilterError
         except Exception as e:
+            error_text = str(e)
             if get_debug():
-                print(f"LiteLLM error: {str(e)}")
+                print(f"LiteLLM error: {error_text}")
             
             # Check if this might be a content filter error based on the error message
-            error_str = str(e).lower()
-            if any(term in error_str for term in ['content filter', 'content_filter', 'contentfilter']):
+            error_lower = error_text.lower()
+            if any(term in error_lower for term in ['content filter', 'content_filter', 'contentfilter']):
                 if get_debug():
-                    print(f"Content filter triggered: {str(e)}")
-                raise Exception(f"Content filter triggered: {str(e)}")
-            
-            # Use provider-specific error handling for generic errors too
-            error_handlers = self.provider_config.get_error_handler()
-            for error_key, handler in error_handlers.items():
-                if error_key in str(e):
-                    error_msg = f"{handler['message']}\n\nOriginal error: {str(e)}"
-                    raise Exception(error_msg)
+                    print(f"Content filter triggered: {error_text}")
+                raise Exception(f"Content filter triggered: {error_text}")
             
-            # Re-raise the original exception if not handled specifically
+            # Use provider-specific error handling for generic errors too, and
+            # re-raise the original exception if not handled specifically
+            self._raise_provider_error(error_text)
             raise e
 
+    def _raise_provider_error(self, error_text: str) -> None:
+        """
+        Raise the provider's message for an error, if it has one.
+
+        Args:
+            error_text: The text of the original error
+
+        Raises:
+            Exception: With the provider-specific message when a key matches
+        """
+        for error_key, message in self._error_messages:
+            if error_key in error_text:
+                raise Exception(f"{message}\n\nOriginal error: {error_text}")
+
     def _transform_messages(
         self, messages: List[Dict[str, Any]], system: str = None
     ) -> List[Dict[str, Any]]:
@@ -318,114 +327,6 @@ class LLMClient:
             # For streaming, return a generator that transforms each chunk
             return self._transform_streaming_response(response)
         
-        # Create an object that mimics the structure expected by the existing code
-        class TransformedResponse:
-            def __init__(self, llm_response):
-                # Basic response metadata
-                self.id = getattr(llm_response, "id", "chatcmpl-" + str(hash(str(llm_response)))[:8])
-                self.created = getattr(llm_response, "created", 0)
-                self.model = getattr(llm_response, "model", "")
-                self.object = "chat.completion"
-                self.system_fingerprint = getattr(llm_response, "system_fingerprint", None)
-                self.response_ms = getattr(llm_response, "response_ms", 0)
-                
-                # Handle usage information
-                self.usage = None
-                if hasattr(llm_response, "usage") and llm_response.usage:
-                    class Usage:
-                        def __init__(self, usage_data):
-                            if isinstance(usage_data, dict):
-                                self.input_tokens = usage_data.get("prompt_tokens", 0)
-                                self.output_tokens = usage_data.get("completion_tokens", 0)
-                                self.total_tokens = usage_data.get("total_tokens", 0)
-                            else:
-                                self.input_tokens = getattr(usage_data, "prompt_tokens", 0)
-                                self.output_tokens = getattr(usage_data, "completion_tokens", 0)
-                                self.total_tokens = getattr(usage_data, "total_tokens", 0)
-                    
-                    self.usage = Usage(llm_response.usage)
-                
-                # Handle content format
-                self.content = []
-                self.choices = []
-                
-                if hasattr(llm_response, "choices") and llm_response.choices:
-                    for i, choice in enumerate(llm_response.choices):
-                        # Process message content and tool calls
-                        message_content = ""
-                        message_tool_calls = None
-                        message_function_call = None
-                        
-                        if hasattr(choice, "message"):
-                            msg = choice.message
-                            if isinstance(msg, dict):
-                                message_content = msg.get("content", "")
-                                
-                                # Extract tool calls and function calls if present
-                                if "tool_calls" in msg:
-                                    message_tool_calls = msg.get("tool_calls")
-                                if "function_call" in msg:
-                                    message_function_call = msg.get("function_call")
-                            else:
-                                # If message is an object with attributes
-                                message_content = getattr(msg, "content", "")
-                                message_tool_calls = getattr(msg, "tool_calls", None)
-                                message_function_call = getattr(msg, "function_call", None)
-                        
-                        # Create message object
-                        message = {
-                            "content": message_content,
-                            "role": "assistant",
-                            "tool_calls": message_tool_calls,
-                            "function_call": message_function_call
-                        }
-                        
-                        # Get finish_reason, handling different formats
-                        finish_reason = None
-                        if hasattr(choice, "finish_reason"):
-                            finish_reason = choice.finish_reason
-                        elif isinstance(choice, dict) and "finish_reason" in choice:
-                            finish_reason = choice["finish_reason"]
-                        
-                        # Create choice object
-                        choice_obj = {
-                            "finish_reason": finish_reason or "stop",
-                            "index": i,
-                            "message": message,
-                            "logprobs": getattr(choice, "logprobs", None)
-                        }
-                        
-                        self.choices.append(choice_obj)
-                        
-                        # For backward compatibility with code expecting content
-                        class ContentItem:
-                            def __init__(self, text):
-                                self.text = text
-                                self.type = "text"
-                        
-                        self.content.append(ContentItem(message_content))
-                
-                # Dictionary-style and attribute-style access
-                def __getitem__(self, key):
-                    return getattr(self, key)
-                
-                def to_dict(self):
-                    """Convert to dict for debugging."""
-                    return {
-                        "id": self.id,
-                        "created": self.created,
-                        "model": self.model,
-                        "object": self.object,
-                        "system_fingerprint": self.system_fingerprint,
-                        "choices": self.choices,
-                        "usage": self.usage.__dict__ if self.usage else None
-                    }
-                
-                def __str__(self):
-                    # Lazy import json only when needed
-                    import json
-                    return json.dumps(self.to_dict(), indent=2)
-        
         # Debug message for received response
         if get_debug():
             from rich.console import Console
@@ -478,7 +379,7 @@ class LLMClient:
                 if hasattr(usage, 'prompt_tokens') and hasattr(usage, 'completion_tokens'):
                     console.print(f"[#FF8800]Token usage:[/#FF8800] {usage.prompt_tokens} input, {usage.completion_tokens} output, {getattr(usage, 'total_tokens', usage.prompt_tokens + usage.completion_tokens)} total")
         
-        return TransformedResponse(response)
+        return _TransformedResponse(response)
     
     def _transform_streaming_response(self, streaming_response):
         """
@@ -491,100 +392,232 @@ class LLMClient:
             Generator that yields transformed response chunks with OpenAI-compatible structure
         """
         for chunk in streaming_response:
-            # Create a class to mimic the structure expected by the existing code
-            class TransformedChunk:
-                def __init__(self, chunk):
-                    self.id = getattr(chunk, "id", "chatcmpl-" + str(hash(str(chunk)))[:8])
-                    self.created = getattr(chunk, "created", 0)
-                    self.model = getattr(chunk, "model", "")
-                    self.object = "chat.completion.chunk"
-                    self.system_fingerprint = None
-                    
-                    # Handle content format
-                    self.choices = []
-                    if hasattr(chunk, "choices") and chunk.choices:
-                        for i, choice in enumerate(chunk.choices):
-                            # Extract delta content and other elements
-                            content = ""
-                            function_call = None
-                            tool_calls = None
-                            
-                            # Handle different possible delta formats
-                            if hasattr(choice, "delta"):
-                                delta_obj = choice.delta
-                                if hasattr(delta_obj, "content"):
-                                    content = delta_obj.content
-                                elif isinstance(delta_obj, dict) and "content" in delta_obj:
-                                    content = delta_obj["content"]
-                                
-                                # Extract function call if present
-                                if hasattr(delta_obj, "function_call"):
-                                    function_call = delta_obj.function_call
-                                elif isinstance(delta_obj, dict) and "function_call" in delta_obj:
-                                    function_call = delta_obj["function_call"]
-                                
-                                # Extract tool calls if present
-                                if hasattr(delta_obj, "tool_calls"):
-                                    tool_calls = delta_obj.tool_calls
-                                elif isinstance(delta_obj, dict) and "tool_calls" in delta_obj:
-                                    tool_calls = delta_obj["tool_calls"]
-                            
-                            # Create delta object
-                            delta = {
-                                "content": content,
-                                "role": "assistant",
-                                "function_call": function_call,
-                                "tool_calls": tool_calls,
-                                "audio": None
-                            }
-                            
-                            # Get finish_reason, handling different formats
-                            finish_reason = None
-                            if hasattr(choice, "finish_reason"):
-                                finish_reason = choice.finish_reason
-                            elif isinstance(choice, dict) and "finish_reason" in choice:
-                                finish_reason = choice["finish_reason"]
-                            
-                            # Create choice object
-                            choice_obj = {
-                                "finish_reason": finish_reason,
-                                "index": i,
-                                "delta": delta,
-                                "logprobs": getattr(choice, "logprobs", None)
-                            }
-                            
-                            self.choices.append(choice_obj)
-                    
-                    # Add content array for compatibility
-                    self.content = []
-                    if self.choices and "content" in self.choices[0].get("delta", {}):
-                        class ContentItem:
-                            def __init__(self, text):
-                                self.text = text
-                                self.type = "text"
+            yield _TransformedChunk(chunk)
+
+
+class _ContentItem:
+    """Text content block, for code that reads response.content[0].text."""
+
+    __slots__ = ("text", "type")
+
+    def __init__(self, text):
+        self.text = text
+        self.type = "text"
+
+
+class _Usage:
+    """Token usage of a response."""
+
+    __slots__ = ("input_tokens", "output_tokens", "total_tokens")
+
+    def __init__(self, usage_data):
+        if isinstance(usage_data, dict):
+            self.input_tokens = usage_data.get("prompt_tokens", 0)
+            self.output_tokens = usage_data.get("completion_tokens", 0)
+            self.total_tokens = usage_data.get("total_tokens", 0)
+        else:
+            self.input_tokens = getattr(usage_data, "prompt_tokens", 0)
+            self.output_tokens = getattr(usage_data, "completion_tokens", 0)
+            self.total_tokens = getattr(usage_data, "total_tokens", 0)
+
+    def to_dict(self):
+        """Convert to dict for debugging."""
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+        }
+
+
+class _TransformedResponse:
+    """LiteLLM response in the structure expected by the existing code."""
+
+    __slots__ = (
+        "id", "created", "model", "object", "system_fingerprint",
+        "response_ms", "usage", "content", "choices",
+    )
+
+    def __init__(self, llm_response):
+        # Basic response metadata
+        self.id = getattr(llm_response, "id", "chatcmpl-" + str(hash(str(llm_response)))[:8])
+        self.created = getattr(llm_response, "created", 0)
+        self.model = getattr(llm_response, "model", "")
+        self.object = "chat.completion"
+        self.system_fingerprint = getattr(llm_response, "system_fingerprint", None)
+        self.response_ms = getattr(llm_response, "response_ms", 0)
+        
+        # Handle usage information
+        self.usage = None
+        if hasattr(llm_response, "usage") and llm_response.usage:
+            self.usage = _Usage(llm_response.usage)
+        
+        # Handle content format
+        self.content = []
+        self.choices = []
+        
+        if hasattr(llm_response, "choices") and llm_response.choices:
+            for i, choice in enumerate(llm_response.choices):
+                # Process message content and tool calls
+                message_content = ""
+                message_tool_calls = None
+                message_function_call = None
+                
+                if hasattr(choice, "message"):
+                    msg = choice.message
+                    if isinstance(msg, dict):
+                        message_content = msg.get("content", "")
                         
-                        content_text = self.choices[0]["delta"]["content"]
-                        if content_text:
-                            self.content.append(ContentItem(content_text))
-                            
-                    # Dictionary-style access
-                    def __getitem__(self, key):
-                        return getattr(self, key)
+                        # Extract tool calls and function calls if present
+                        if "tool_calls" in msg:
+                            message_tool_calls = msg.get("tool_calls")
+                        if "function_call" in msg:
+                            message_function_call = msg.get("function_call")
+                    else:
+                        # If message is an object with attributes
+                        message_content = getattr(msg, "content", "")
+                        message_tool_calls = getattr(msg, "tool_calls", None)
+                        message_function_call = getattr(msg, "function_call", None)
+                
+                # Create message object
+                message = {
+                    "content": message_content,
+                    "role": "assistant",
+                    "tool_calls": message_tool_calls,
+                    "function_call": message_function_call
+                }
+                
+                # Get finish_reason, handling different formats
+                finish_reason = None
+                if hasattr(choice, "finish_reason"):
+                    finish_reason = choice.finish_reason
+                elif isinstance(choice, dict) and "finish_reason" in choice:
+                    finish_reason = choice["finish_reason"]
+                
+                # Create choice object
+                choice_obj = {
+                    "finish_reason": finish_reason or "stop",
+                    "index": i,
+                    "message": message,
+                    "logprobs": getattr(choice, "logprobs", None)
+                }
+                
+                self.choices.append(choice_obj)
+                
+                # For backward compatibility with code expecting content
+                self.content.append(_ContentItem(message_content))
+
+    # Dictionary-style and attribute-style access
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def to_dict(self):
+        """Convert to dict for debugging."""
+        return {
+            "id": self.id,
+            "created": self.created,
+            "model": self.model,
+            "object": self.object,
+            "system_fingerprint": self.system_fingerprint,
+            "choices": self.choices,
+            "usage": self.usage.to_dict() if self.usage else None
+        }
+
+    def __str__(self):
+        # Lazy import json only when needed
+        import json
+        return json.dumps(self.to_dict(), indent=2, default=str)
+
+
+class _TransformedChunk:
+    """LiteLLM streaming chunk in the structure expected by the existing code."""
+
+    __slots__ = ("id", "created", "model", "object", "system_fingerprint", "choices", "content")
+
+    def __init__(self, chunk):
+        self.id = getattr(chunk, "id", "chatcmpl-" + str(hash(str(chunk)))[:8])
+        self.created = getattr(chunk, "created", 0)
+        self.model = getattr(chunk, "model", "")
+        self.object = "chat.completion.chunk"
+        self.system_fingerprint = None
+        
+        # Handle content format
+        self.choices = []
+        if hasattr(chunk, "choices") and chunk.choices:
+            for i, choice in enumerate(chunk.choices):
+                # Extract delta content and other elements
+                content = ""
+                function_call = None
+                tool_calls = None
+                
+                # Handle different possible delta formats
+                if hasattr(choice, "delta"):
+                    delta_obj = choice.delta
+                    if hasattr(delta_obj, "content"):
+                        content = delta_obj.content
+                    elif isinstance(delta_obj, dict) and "content" in delta_obj:
+                        content = delta_obj["content"]
                     
-                    def to_dict(self):
-                        """Convert to dict for debugging."""
-                        return {
-                            "id": self.id,
-                            "created": self.created,
-                            "model": self.model,
-                            "object": self.object,
-                            "system_fingerprint": self.system_fingerprint,
-                            "choices": self.choices
-                        }
+                    # Extract function call if present
+                    if hasattr(delta_obj, "function_call"):
+                        function_call = delta_obj.function_call
+                    elif isinstance(delta_obj, dict) and "function_call" in delta_obj:
+                        function_call = delta_obj["function_call"]
                     
-                    def __str__(self):
-                        # Lazy import json only when needed
-                        import json
-                        return json.dumps(self.to_dict(), indent=2)
-            
-            yield TransformedChunk(chunk)
\ No newline at end of file
+                    # Extract tool calls if present
+                    if hasattr(delta_obj, "tool_calls"):
+                        tool_calls = delta_obj.tool_calls
+                    elif isinstance(delta_obj, dict) and "tool_calls" in delta_obj:
+                        tool_calls = delta_obj["tool_calls"]
+                
+                # Create delta object
+                delta = {
+                    "content": content,
+                    "role": "assistant",
+                    "function_call": function_call,
+                    "tool_calls": tool_calls,
+                    "audio": None
+                }
+                
+                # Get finish_reason, handling different formats
+                finish_reason = None
+                if hasattr(choice, "finish_reason"):
+                    finish_reason = choice.finish_reason
+                elif isinstance(choice, dict) and "finish_reason" in choice:
+                    finish_reason = choice["finish_reason"]
+                
+                # Create choice object
+                choice_obj = {
+                    "finish_reason": finish_reason,
+                    "index": i,
+                    "delta": delta,
+                    "logprobs": getattr(choice, "logprobs", None)
+                }
+                
+                self.choices.append(choice_obj)
+        
+        # Add content array for compatibility
+        self.content = []
+        if self.choices and "content" in self.choices[0].get("delta", {}):
+            content_text = self.choices[0]["delta"]["content"]
+            if content_text:
+                self.content.append(_ContentItem(content_text))
+
+    # Dictionary-style access
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def to_dict(self):
+        """Convert to dict for debugging."""
+        return {
+            "id": self.id,
+            "created": self.created,
+            "model": self.model,
+            "object": self.object,
+            "system_fingerprint": self.system_fingerprint,
+            "choices": self.choices
+        }
+
+    def __str__(self):
+        # Lazy import json only when needed
+        import json
+        return json.dumps(self.to_dict(), indent=2, default=str)
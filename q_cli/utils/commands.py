@@ -1,5 +1,6 @@
 """Command execution functionality for q_cli."""
 
+import functools
 import os
 import subprocess
 import re
@@ -47,6 +48,15 @@ BLOCKED_COMMANDS = [
     "> /dev", "> /proc", "dd if="
 ]
 
+# Heredoc redirection such as <<EOF or << 'END', compiled once for every command
+_HEREDOC_RE = re.compile(r'<<\s*[\'"]*([^\'"\s<]*)[\'"]*')
+
+
+@functools.lru_cache(maxsize=1)
+def _real_home_dir() -> str:
+    """Resolve the user's home directory once; it can't change during a run."""
+    return os.path.realpath(os.path.expanduser("~"))
+
 
 def is_dangerous_command(command: str) -> bool:
     """Check if a command is potentially dangerous."""
@@ -79,7 +89,7 @@ def execute_command(command: str, console: Console, skip_dangerous_check: bool =
         return (-1, "", "This command has been blocked for security reasons.")
 
     # Check if this is a heredoc command
-    heredoc_match = re.search(r'<<\s*[\'"]*([^\'"\s<]*)[\'"]*', command)
+    heredoc_match = _HEREDOC_RE.search(command)
     if heredoc_match:
         if get_debug():
             console.print(
@@ -204,7 +214,7 @@ def ask_command_confirmation(
         - Whether to remember this choice for similar commands (True/False) or "approve_all" for global approval
     """
     # Check for heredoc pattern before anything else
-    heredoc_match = re.search(r'<<\s*[\'"]*([^\'"\s<]*)[\'"]*', command)
+    heredoc_match = _HEREDOC_RE.search(command)
     if heredoc_match:
         if get_debug():
             console.print("\n[yellow]Q suggested a heredoc command:[/yellow]")
@@ -494,17 +504,15 @@ def is_line_continuation(line: str) -> bool:
     Returns:
         True if the line ends with a line continuation backslash, False otherwise
     """
-    if not line.rstrip().endswith("\\"):
+    stripped = line.rstrip()
+    if not stripped.endswith("\\"):
         return False
 
     # Count backslashes at the end of the line
-    match = re.search(r"(\\+)$", line.rstrip())
-    if not match:
-        return False
+    backslash_count = len(stripped) - len(stripped.rstrip("\\"))
 
     # If odd number of backslashes, it's a line continuation
     # If even, the last backslash is escaped
-    backslash_count = len(match.group(1))
     return backslash_count % 2 == 1
 
 
@@ -659,9 +667,8 @@ def read_file_from_marker(
             
             # Check if path is within current directory tree or user's home directory
             in_current_dir = real_path.startswith(os.path.realpath(cwd))
-            in_home_dir = real_path.startswith(os.path.realpath(os.path.expanduser("~")))
             
-            if not (in_current_dir or in_home_dir):
+            if not (in_current_dir or real_path.startswith(_real_home_dir())):
                 # Path is outside of safe directories
                 if get_debug():
                     console.print(f"[yellow]Path traversal attempt - path points outside of allowed directories: {real_path}[/yellow]")
@@ -912,9 +919,8 @@ def write_file_from_marker(
             
             # Check if path is within current directory tree or user's home directory
             in_current_dir = real_path.startswith(os.path.realpath(cwd))
-            in_home_dir = real_path.startswith(os.path.realpath(os.path.expanduser("~")))
             
-            if not (in_current_dir or in_home_dir):
+            if not (in_current_dir or real_path.startswith(_real_home_dir())):
                 # Path is outside of safe directories
                 if get_debug():
                     console.print(f"[yellow]Path traversal attempt - path points outside of allowed directories: {real_path}[/yellow]")
@@ -76,6 +76,9 @@ SENSITIVE_PATTERNS = [
 ]
 REDACTED_TEXT = "[REDACTED - Potential sensitive information]"
 
+# Context files
+MAX_CONTEXT_FILE_SIZE = 10 * 1024 * 1024  # Larger context files are skipped
+
 # Display options
 MAX_FILE_DISPLAY_LENGTH = 500  # Characters to show when previewing file content
 MAX_FILE_TREE_ENTRIES = 100  # Maximum number of entries to include in file tree
@@ -87,4 +90,4 @@ PROMPTS_DIR = os.path.join(
 )
 
 # Commands
-EXIT_COMMANDS = ["exit", "quit", "q"]
\ No newline at end of file
+EXIT_COMMANDS = frozenset({"exit", "quit", "q"})
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Context management utilities for Q."""
 
+import operator
 import os
 import tiktoken
 import time
@@ -280,6 +281,37 @@ class ContextManager:
         # For other priorities, calculate based on percentage allocation
         return int(self.max_tokens * self.token_allocations[priority])
 
+    def remaining_budget(self, priority: str) -> int:
+        """
+        Get how many more tokens a priority level can take before it is trimmed.
+
+        Uses the same targets as optimize_context, based on the items added
+        so far.
+
+        Args:
+            priority: Priority level
+
+        Returns:
+            Remaining token budget for the priority level (never negative)
+        """
+        token_budget = self.max_tokens - self.system_prompt_tokens
+        if token_budget <= 0:
+            return 0
+
+        tokens = self.get_tokens_by_priority()
+        essential_limit = int(token_budget * self.token_allocations[ESSENTIAL_PRIORITY])
+        if priority == ESSENTIAL_PRIORITY:
+            return max(0, essential_limit - tokens[ESSENTIAL_PRIORITY])
+
+        # Unused essential tokens are reclaimed by the other priorities
+        remaining = token_budget - min(essential_limit, tokens[ESSENTIAL_PRIORITY])
+        important_limit = int(remaining * 0.7)
+        if priority == IMPORTANT_PRIORITY:
+            return max(0, important_limit - tokens[IMPORTANT_PRIORITY])
+
+        supplementary_limit = remaining - min(important_limit, tokens[IMPORTANT_PRIORITY])
+        return max(0, supplementary_limit - tokens[SUPPLEMENTARY_PRIORITY])
+
     def _trim_context_items(
         self, priority: str, target_tokens: int
     ) -> List[ContextItem]:
@@ -304,7 +336,7 @@ class ContextManager:
         # For supplementary items, we'll cut the largest ones first
         # For essential/important items, we'll trim from the oldest
         if priority == SUPPLEMENTARY_PRIORITY:
-            sorted_items = sorted(items, key=lambda x: x.token_count, reverse=True)
+            sorted_items = sorted(items, key=operator.attrgetter("token_count"), reverse=True)
         else:
             # Keep the most recent items (assumes items were added in chronological order)
             sorted_items = items.copy()
@@ -1,11 +1,23 @@
 """Helper functions used throughout the q_cli package."""
 
+import functools
 import os
 import re
-from typing import Dict, List, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 
 from rich.console import Console
-from rich.markdown import Markdown
+
+if TYPE_CHECKING:
+    # rich.markdown pulls in the markdown parser; it is imported lazily by
+    # format_markdown so importing helpers stays cheap
+    from rich.markdown import Markdown
+
+# Optional linear-time regex engine for scanning large context files
+try:
+    import re2
+    RE2_INSTALLED = True
+except ImportError:
+    RE2_INSTALLED = False
 
 from q_cli.utils.constants import SENSITIVE_PATTERNS, REDACTED_TEXT, get_debug
 
@@ -14,13 +26,117 @@ Message = Dict[str, str]
 Conversation = List[Message]
 
 
+def _drop_subsumed_patterns(patterns: List[str]) -> List[str]:
+    """
+    Remove patterns that contain another pattern as a substring.
+
+    Any text matching "api_key" also matches "key", so the longer pattern
+    only adds work to every position the scan tries.
+
+    Args:
+        patterns: Literal patterns, compared case-insensitively
+
+    Returns:
+        The patterns not covered by a shorter one, in their original order
+    """
+    lowered = {pattern.lower() for pattern in patterns}
+    return [
+        pattern
+        for pattern in patterns
+        if not any(
+            other != pattern.lower() and other in pattern.lower() for other in lowered
+        )
+    ]
+
+
+# Case-insensitive alternation of SENSITIVE_PATTERNS for scanning whole texts.
+# RE2 is used when installed so the scan stays linear-time on any input.
+_SENSITIVE_PATTERN = "(?i)" + "|".join(
+    re.escape(pattern) for pattern in _drop_subsumed_patterns(SENSITIVE_PATTERNS)
+)
+_SENSITIVE_RE = (re2 if RE2_INSTALLED else re).compile(_SENSITIVE_PATTERN)
+_SENSITIVE_RE_BYTES = (re2 if RE2_INSTALLED else re).compile(
+    _SENSITIVE_PATTERN.encode()
+)
+_REDACTED_BYTES = REDACTED_TEXT.encode()
+
+# Matches ${VAR} and $VAR references in a single pass
+_ENV_VAR_RE = re.compile(r"\$\{(\w+)\}|\$(\w+)")
+
+
 def contains_sensitive_info(text: str) -> bool:
     """Check if text contains potentially sensitive information."""
-    text_lower = text.lower()
-    return any(pattern in text_lower for pattern in SENSITIVE_PATTERNS)
+    return _SENSITIVE_RE.search(text) is not None
+
+
+def redact_sensitive_lines(text: str) -> str:
+    """
+    Replace every line containing sensitive information with REDACTED_TEXT.
+
+    The whole text is scanned with one compiled pattern, so clean text is
+    returned as-is and only the matching lines are spliced.
+
+    Args:
+        text: The text to redact
+
+    Returns:
+        The text with sensitive lines redacted
+    """
+    match = _SENSITIVE_RE.search(text)
+    if match is None:
+        return text
+
+    parts = []
+    pos = 0
+    while match:
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        line_end = text.find("\n", match.end())
+        if line_end == -1:
+            line_end = len(text)
+        parts.append(text[pos:line_start])
+        parts.append(REDACTED_TEXT)
+        pos = line_end
+        match = _SENSITIVE_RE.search(text, line_end)
 
+    parts.append(text[pos:])
+    return "".join(parts)
 
-def format_markdown(text: str) -> Markdown:
+
+def redact_sensitive_bytes(data: bytes) -> bytes:
+    """
+    Byte-level variant of redact_sensitive_lines for undecoded file content.
+
+    Accepts any buffer supporting find/rfind and slicing (bytes or mmap).
+    Clean input is returned as-is without copying, so callers can decode it
+    directly.
+
+    Args:
+        data: The raw content to redact
+
+    Returns:
+        The content with sensitive lines redacted
+    """
+    match = _SENSITIVE_RE_BYTES.search(data)
+    if match is None:
+        return data
+
+    parts = []
+    pos = 0
+    while match:
+        line_start = data.rfind(b"\n", 0, match.start()) + 1
+        line_end = data.find(b"\n", match.end())
+        if line_end == -1:
+            line_end = len(data)
+        parts.append(data[pos:line_start])
+        parts.append(_REDACTED_BYTES)
+        pos = line_end
+        match = _SENSITIVE_RE_BYTES.search(data, line_end)
+
+    parts.append(data[pos:])
+    return b"".join(parts)
+
+
+def format_markdown(text: str) -> "Markdown":
     """
     Format markdown text into Rich-formatted text for terminal display.
 
@@ -30,6 +146,8 @@ def format_markdown(text: str) -> Markdown:
     Returns:
         A Rich Markdown object that can be printed to the console
     """
+    from rich.markdown import Markdown
+
     return Markdown(text)
 
 
@@ -66,16 +184,48 @@ def clean_operation_codeblocks(text: str) -> str:
     return text
 
 
-def expand_env_vars(text: str) -> str:
-    """Replace environment variables in text."""
+def expand_env_vars(text: str, env: Optional[Dict[str, str]] = None) -> str:
+    """
+    Replace environment variables in text.
+
+    Args:
+        text: The text containing $VAR or ${VAR} references
+        env: Optional snapshot of the environment to resolve against; callers
+            expanding many strings can pass dict(os.environ) once
+
+    Returns:
+        The text with variables substituted (unknown variables become empty)
+    """
     if "$" not in text:
         return text
 
-    # Handle ${VAR} format
-    text = re.sub(r"\${(\w+)}", lambda m: os.environ.get(m.group(1), ""), text)
-    # Handle $VAR format
-    text = re.sub(r"\$(\w+)", lambda m: os.environ.get(m.group(1), ""), text)
-    return text
+    if env is None:
+        env = os.environ
+    literals, names = _split_env_template(text)
+    parts = [literals[0]]
+    for name, literal in zip(names, literals[1:]):
+        parts.append(env.get(name, ""))
+        parts.append(literal)
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_env_template(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Split text into literal segments and the variable names between them.
+
+    Only the parse is cached; values are looked up on every expansion so
+    changes to the environment are always picked up.
+    """
+    literals = []
+    names = []
+    pos = 0
+    for match in _ENV_VAR_RE.finditer(text):
+        literals.append(text[pos:match.start()])
+        names.append(match.group(1) or match.group(2))
+        pos = match.end()
+    literals.append(text[pos:])
+    return tuple(literals), tuple(names)
 
 
 def sanitize_context(context: str, console: Console) -> str:
@@ -83,20 +233,19 @@ def sanitize_context(context: str, console: Console) -> str:
     if not context:
         return ""
 
-    lines = context.split("\n")
-    for i, line in enumerate(lines):
-        # First expand environment variables in the line
-        lines[i] = expand_env_vars(line)
+    # First expand environment variables; references never span lines, so
+    # the whole context can be expanded at once
+    context = expand_env_vars(context)
 
-        # Then check for sensitive information
-        if contains_sensitive_info(lines[i]):
-            console.print(
-                "Warning: Potentially sensitive information found in context. Redacting.",
-                style="warning",
-            )
-            lines[i] = REDACTED_TEXT
+    # Then redact lines with sensitive information in a single scan
+    sanitized = redact_sensitive_lines(context)
+    if sanitized is not context:
+        console.print(
+            "Warning: Potentially sensitive information found in context. Redacting.",
+            style="warning",
+        )
 
-    return "\n".join(lines)
+    return sanitized
 
 
 def parse_version(version_str: str) -> List[int]:
@@ -367,11 +516,15 @@ def get_working_and_project_dirs() -> str:
         # List all files in the project directory with full paths
         try:
             file_list = []
-            for root, _, files in os.walk(project_dir):
+            for root, dirs, files in os.walk(project_dir):
                 # Skip .git and other hidden directories
                 if "/." in root:
                     continue
 
+                # Prune hidden directories so the walk never descends into
+                # them (a .git tree alone can hold thousands of entries)
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+
                 for file in files:
                     # Skip hidden files
                     if file.startswith("."):
@@ -14,7 +14,7 @@ from q_cli.cli.context_setup import (
 class TestContextSetup:
     """Tests for context setup."""
 
-    @patch("q_cli.io.input.confirm_context")
+    @patch("q_cli.cli.context_setup.confirm_context")
     def test_handle_context_confirmation_without_flag(self, mock_confirm_context):
         """Test context confirmation handling when flag is not set."""
         # Setup arguments
@@ -35,7 +35,7 @@ class TestContextSetup:
         mock_confirm_context.assert_not_called()
         console.print.assert_not_called()
 
-    @patch("q_cli.io.input.confirm_context")
+    @patch("q_cli.cli.context_setup.confirm_context")
     def test_handle_context_confirmation_with_flag_accepted(self, mock_confirm_context):
         """Test context confirmation handling when flag is set and user accepts."""
         # Setup arguments
@@ -60,7 +60,7 @@ class TestContextSetup:
         console.print.assert_any_call("\n[bold cyan]Sanitized Context:[/bold cyan]")
         console.print.assert_any_call("test context")
 
-    @patch("q_cli.io.input.confirm_context")
+    @patch("q_cli.cli.context_setup.confirm_context")
     def test_handle_context_confirmation_with_flag_rejected(self, mock_confirm_context):
         """Test context confirmation handling when flag is set and user rejects."""
         # Setup arguments
@@ -79,12 +79,11 @@ class TestContextSetup:
             args, prompt_session, "test context", "test system prompt", console
         )
 
-        # True is returned when context confirmation is not implemented
-        assert result is True
-        # Should print rejection message in the future implementation
-        # console.print.assert_any_call("Context rejected. Exiting.", style="info")
+        # Rejecting the context tells the caller to exit
+        assert result is False
+        console.print.assert_any_call("Context rejected. Exiting.", style="info")
 
-    @patch("q_cli.io.input.confirm_context")
+    @patch("q_cli.cli.context_setup.confirm_context")
     def test_handle_context_confirmation_empty_context(self, mock_confirm_context):
         """Test context confirmation handling with empty sanitized context."""
         # Setup arguments
@@ -134,20 +133,16 @@ class TestContextSetup:
         # Skip this test as it's difficult to patch correctly
         pytest.skip("Skipping due to module import complexities")
 
-    @patch("q_cli.cli.context_setup.os.path.isdir")
-    @patch("q_cli.cli.context_setup.os.path.isfile")
     @patch("q_cli.cli.context_setup.os.path.exists")
     @patch("q_cli.cli.context_setup.os.getcwd")
-    @patch("q_cli.cli.context_setup.os.listdir")
+    @patch("q_cli.cli.context_setup.os.scandir")
     @patch("q_cli.cli.context_setup.get_system_prompt")
     def test_project_context_setup(
         self,
         mock_get_system_prompt,
-        mock_listdir,
+        mock_scandir,
         mock_getcwd,
         mock_exists,
-        mock_isfile,
-        mock_isdir,
     ):
         """Test setup of project context with file list."""
         # Setup
@@ -159,9 +154,13 @@ class TestContextSetup:
         # Mock file operations
         mock_getcwd.return_value = "/path/to/project"
         mock_exists.return_value = True
-        mock_isdir.return_value = True
-        mock_isfile.return_value = True
-        mock_listdir.return_value = ["project.md", "config.json", "schema.sql"]
+        entries = []
+        for name in ["schema.sql", "project.md", "config.json"]:
+            entry = MagicMock()
+            entry.name = name
+            entry.is_file.return_value = True
+            entries.append(entry)
+        mock_scandir.return_value.__enter__.return_value = entries
 
         # Mock file reading
         project_md_content = "Project notes here"
@@ -197,9 +196,7 @@ class TestContextSetup:
                 )
 
                 # Verify function calls
-                assert mock_listdir.called
-                assert mock_isdir.called
-                assert mock_isfile.called
+                mock_scandir.assert_called_once_with("/path/to/project/.Q")
 
                 # Verify system_prompt call with projectcontext containing both project.md content and file list
                 mock_get_system_prompt.assert_called_once()
@@ -212,8 +209,7 @@ class TestContextSetup:
                     "Additional project information can be found in the following files:"
                     in projectcontext
                 )
-                assert "- config.json" in projectcontext
-                assert "- schema.sql" in projectcontext
+                assert "- config.json\n- schema.sql" in projectcontext
                 # project.md should not be listed as it's already included
                 assert "- project.md" not in projectcontext
 
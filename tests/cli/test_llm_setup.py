@@ -10,6 +10,16 @@ from q_cli.cli.llm_setup import (
     validate_model_for_provider,
     initialize_llm_client
 )
+from q_cli.config.manager import ConfigManager
+
+
+def _load_config_vars(tmp_path, console, text):
+    """Parse config file text the way the CLI does, returning its variables."""
+    config_path = tmp_path / "config"
+    config_path.write_text(text)
+    with patch('q_cli.config.manager.CONFIG_PATH', str(config_path)):
+        _, _, config_vars = ConfigManager(console).load_config()
+    return config_vars
 
 
 class TestLLMSetup:
@@ -135,7 +145,7 @@ class TestLLMSetup:
             assert 'ERROR' in mock_console.print.call_args_list[0][0][0]
             assert 'location' in mock_console.print.call_args_list[0][0][0]
 
-    def test_setup_api_credentials_vertexai_with_comments(self, mock_console, temp_env):
+    def test_setup_api_credentials_vertexai_with_comments(self, mock_console, temp_env, tmp_path):
         """Test setup_api_credentials with VertexAI and commented values."""
         # Create mock args
         args = MagicMock()
@@ -143,12 +153,12 @@ class TestLLMSetup:
         args.api_key = None
         
         # Create config vars with commented values
-        config_vars = {
-            'PROVIDER': 'vertexai',
-            'VERTEXAI_API_KEY': '/path/to/service-account.json  # Path to service account file',
-            'VERTEXAI_PROJECT': 'test-project  # Project ID',
-            'VERTEXAI_LOCATION': 'us-central1  # Location',
-        }
+        config_vars = _load_config_vars(tmp_path, mock_console, (
+            "PROVIDER=vertexai\n"
+            "VERTEXAI_API_KEY=/path/to/service-account.json  # Path to service account file\n"
+            "VERTEXAI_PROJECT=test-project  # Project ID\n"
+            "VERTEXAI_LOCATION=us-central1  # Location\n"
+        ))
         
         # Setup API credentials
         with patch('q_cli.io.config.validate_config'):
@@ -164,7 +174,7 @@ class TestLLMSetup:
             assert args.provider_kwargs['project_id'] == 'test-project'
             assert args.provider_kwargs['location'] == 'us-central1'
 
-    def test_setup_api_credentials_groq_with_comments(self, mock_console, temp_env):
+    def test_setup_api_credentials_groq_with_comments(self, mock_console, temp_env, tmp_path):
         """Test setup_api_credentials with Groq and commented values."""
         # Create mock args
         args = MagicMock()
@@ -172,11 +182,11 @@ class TestLLMSetup:
         args.api_key = None
         
         # Create config vars with commented values
-        config_vars = {
-            'PROVIDER': 'groq',
-            'GROQ_API_KEY': 'gsk_123456  # API key',
-            'GROQ_MAX_TOKENS': '32000  # Default token limit',
-        }
+        config_vars = _load_config_vars(tmp_path, mock_console, (
+            "PROVIDER=groq\n"
+            "GROQ_API_KEY=gsk_123456  # API key\n"
+            "GROQ_MAX_TOKENS=32000  # Default token limit\n"
+        ))
         
         # Setup API credentials
         with patch('q_cli.io.config.validate_config'):
@@ -186,7 +196,7 @@ class TestLLMSetup:
         assert provider == 'groq'
         assert api_key == 'gsk_123456'
 
-    def test_setup_api_credentials_openai_with_comments(self, mock_console, temp_env):
+    def test_setup_api_credentials_openai_with_comments(self, mock_console, temp_env, tmp_path):
         """Test setup_api_credentials with OpenAI and commented values."""
         # Create mock args
         args = MagicMock()
@@ -194,11 +204,11 @@ class TestLLMSetup:
         args.api_key = None
         
         # Create config vars with commented values
-        config_vars = {
-            'PROVIDER': 'openai',
-            'OPENAI_API_KEY': 'sk_123456  # API key',
-            'OPENAI_MAX_TOKENS': '8192  # Default token limit',
-        }
+        config_vars = _load_config_vars(tmp_path, mock_console, (
+            "PROVIDER=openai\n"
+            "OPENAI_API_KEY=sk_123456  # API key\n"
+            "OPENAI_MAX_TOKENS=8192  # Default token limit\n"
+        ))
         
         # Setup API credentials
         with patch('q_cli.io.config.validate_config'):
@@ -290,4 +300,35 @@ class TestLLMSetup:
             
             # Verify environment variable was used
             assert provider == 'anthropic'
-            assert api_key == 'env_api_key'
\ No newline at end of file
+            assert api_key == 'env_api_key'
+
+    def test_setup_api_credentials_config_key_preferred_over_env(self, mock_console, temp_env):
+        """Test that the provider key from config wins over the environment."""
+        args = MagicMock()
+        args.provider = 'anthropic'
+        args.api_key = None
+
+        os.environ['ANTHROPIC_API_KEY'] = 'env_api_key'
+        config_vars = {'ANTHROPIC_API_KEY': 'config_api_key'}
+
+        with patch('q_cli.io.config.validate_config'):
+            provider, api_key = setup_api_credentials(args, config_vars, mock_console, None)
+
+        assert provider == 'anthropic'
+        assert api_key == 'config_api_key'
+        assert args.provider_kwargs == {}
+
+    def test_setup_api_credentials_uses_arg_and_env_keys_as_given(self, mock_console, temp_env):
+        """Test that keys from --api-key and the environment are not comment-stripped."""
+        args = MagicMock()
+        args.provider = 'groq'
+        args.api_key = None
+
+        os.environ['GROQ_API_KEY'] = 'env#key'
+        with patch('q_cli.io.config.validate_config'):
+            _, api_key = setup_api_credentials(args, {}, mock_console, None)
+            assert api_key == 'env#key'
+
+            args.api_key = 'arg#key'
+            _, api_key = setup_api_credentials(args, {}, mock_console, None)
+            assert api_key == 'arg#key'
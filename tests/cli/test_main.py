@@ -93,4 +93,20 @@ class TestConfigureModelSettings:
         
         # Verify fallback to defaults
         assert args.model == 'claude-3-7-sonnet-latest'
-        assert args.max_tokens == 8192
\ No newline at end of file
+        assert args.max_tokens == 8192
+
+
+def test_import_does_not_load_litellm():
+    """Test that importing the CLI entry point doesn't import LiteLLM."""
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, q_cli; sys.exit('litellm' in sys.modules)",
+        ],
+        capture_output=True,
+    )
+    assert result.returncode == 0
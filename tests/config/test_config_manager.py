@@ -5,7 +5,7 @@ import tempfile
 import pytest
 from unittest.mock import MagicMock, patch
 
-from q_cli.config.manager import ConfigManager
+from q_cli.config.manager import ConfigManager, strip_inline_comment
 
 
 class TestConfigManager:
@@ -17,7 +17,7 @@ class TestConfigManager:
         with tempfile.NamedTemporaryFile(mode='w+', delete=False) as f:
             config_content = """
 # Q CLI Configuration
-API_KEY=test-api-key
+API_KEY=test-api-key  # Generic key
 PROVIDER=vertexai
 VERTEXAI_API_KEY=/path/to/service-account.json  # Path to service account file
 VERTEXAI_PROJECT=test-project  # Default project ID
@@ -98,4 +98,68 @@ ANTHROPIC_MAX_TOKENS=32000     # Default for Claude models
         is_valid = config_manager.validate_config()
         
         # Verify validation succeeded with commented values
-        assert is_valid is True
\ No newline at end of file
+        assert is_valid is True
+
+    def test_strip_inline_comment(self):
+        """Test inline comment removal from config values."""
+        assert strip_inline_comment("8192       # Default limit") == "8192"
+        assert strip_inline_comment("us-central1#no space") == "us-central1"
+        assert strip_inline_comment("  plain value  ") == "plain value"
+        assert strip_inline_comment("# only a comment") == ""
+
+    def test_load_config_cached_until_file_changes(self, mock_console, tmp_path):
+        """Test that parsed config is cached but re-read after the file changes."""
+        config_path = tmp_path / "q.conf"
+        config_path.write_text("PROVIDER=anthropic\n")
+
+        with patch('q_cli.config.manager.CONFIG_PATH', str(config_path)):
+            _, _, config_vars = ConfigManager(mock_console).load_config()
+            assert config_vars == {'PROVIDER': 'anthropic'}
+
+            # Mutating the returned dict must not leak into the cache
+            config_vars['PROVIDER'] = 'mutated'
+            _, _, config_vars = ConfigManager(mock_console).load_config()
+            assert config_vars == {'PROVIDER': 'anthropic'}
+
+            # Changing the file invalidates the cached parse
+            config_path.write_text("PROVIDER=openai\nOPENAI_MODEL=gpt-4o\n")
+            _, _, config_vars = ConfigManager(mock_console).load_config()
+            assert config_vars == {'PROVIDER': 'openai', 'OPENAI_MODEL': 'gpt-4o'}
+
+    def test_update_config_provider(self, mock_console, tmp_path):
+        """Test that provider and model lines are replaced or appended."""
+        config_path = tmp_path / "q.conf"
+        config_path.write_text(
+            "# Q CLI Configuration\nPROVIDER=anthropic\nOPENAI_MODEL=old-model\nOTHER=1\n"
+        )
+
+        with patch('q_cli.config.manager.CONFIG_PATH', str(config_path)):
+            assert ConfigManager(mock_console).update_config_provider("openai", "gpt-4o")
+
+        assert config_path.read_text() == (
+            "# Q CLI Configuration\nPROVIDER=openai\nOPENAI_MODEL=gpt-4o\nOTHER=1\n"
+        )
+
+        with patch('q_cli.config.manager.CONFIG_PATH', str(config_path)):
+            assert ConfigManager(mock_console).update_config_provider("groq", "llama")
+
+        assert config_path.read_text().endswith("OTHER=1\nGROQ_MODEL=llama\n")
+        assert "PROVIDER=groq\n" in config_path.read_text()
+
+    def test_update_config_provider_is_atomic(self, mock_console, tmp_path):
+        """Test that a failed write leaves the original config and no temp files."""
+        config_path = tmp_path / "q.conf"
+        config_path.write_text("PROVIDER=anthropic\n")
+        os.chmod(config_path, 0o600)
+
+        with patch('q_cli.config.manager.CONFIG_PATH', str(config_path)):
+            with patch('q_cli.config.manager.os.replace', side_effect=OSError("disk full")):
+                assert not ConfigManager(mock_console).update_config_provider("openai")
+
+            assert config_path.read_text() == "PROVIDER=anthropic\n"
+            assert os.listdir(tmp_path) == ["q.conf"]
+
+            assert ConfigManager(mock_console).update_config_provider("openai")
+
+        assert config_path.read_text() == "PROVIDER=openai\n"
+        assert os.stat(config_path).st_mode & 0o777 == 0o600
@@ -0,0 +1,183 @@
+"""Tests for completion module."""
+
+import os
+from unittest.mock import patch
+
+from prompt_toolkit.document import Document
+
+from q_cli.io.completion import (
+    FILE_TYPE_DESCRIPTIONS,
+    CombinedCompleter,
+    SlashCommandCompleter,
+    SmartPathCompleter,
+    describe_file,
+)
+
+
+def test_describe_file_matches_splitext():
+    """Test that file descriptions follow os.path.splitext extension rules."""
+    for name in (
+        "main.py", "README.MD", "a..json", "Makefile", ".py", "..md", ".a.Py", "x.tar.pdf", "noext."
+    ):
+        expected = FILE_TYPE_DESCRIPTIONS.get(
+            os.path.splitext(name)[1].lower(), "File"
+        )
+        assert describe_file(name) == expected
+
+
+def test_slash_command_completions():
+    """Test that slash commands complete in sorted order by prefix."""
+    completer = SlashCommandCompleter()
+
+    assert [c.display_text for c in completer.get_completions(Document("/"), None)] == [
+        "/recover",
+        "/save",
+        "/transplant",
+    ]
+    assert [c.text for c in completer.get_completions(Document("/tr"), None)] == ["ansplant"]
+    assert [c.text for c in completer.get_completions(Document("/save"), None)] == [""]
+    assert list(completer.get_completions(Document("/sx"), None)) == []
+    assert list(completer.get_completions(Document("/transplanted"), None)) == []
+    assert list(completer.get_completions(Document("save"), None)) == []
+
+
+def test_free_text_only_completes_path_like_words(tmp_path, monkeypatch):
+    """Test that plain words in a sentence don't trigger path completion."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "main.py").write_text("")
+    (tmp_path / "src").mkdir()
+    completer = CombinedCompleter()
+
+    def complete(text):
+        return [c.text for c in completer.get_completions(Document(text), None)]
+
+    assert complete("explain ") == []
+    assert complete("explain ma") == []
+    assert complete("explain main.") == ["main.py"]
+    assert complete("explain ./s") == ["./src/"]
+
+    # /save always completes paths, relative to the cursor
+    completions = list(completer.get_completions(Document("/save ma"), None))
+    assert [(c.text, c.start_position, c.display_meta_text) for c in completions] == [
+        ("main.py", -2, "Save to this file")
+    ]
+
+
+class TestSmartPathCompleter:
+    """Tests for the smart path completer."""
+
+    def test_get_word_under_cursor(self):
+        """Test that the trailing word before the cursor is extracted."""
+        completer = SmartPathCompleter()
+
+        assert completer.get_word_under_cursor(Document("read src/ma")) == ("src/ma", 5)
+        assert completer.get_word_under_cursor(Document("read ")) == ("", 5)
+        assert completer.get_word_under_cursor(Document("")) == ("", 0)
+
+    def test_get_word_under_cursor_mid_text(self):
+        """Test that only text before the cursor is considered."""
+        completer = SmartPathCompleter()
+        document = Document("first line\nopen docs/in more", cursor_position=22)
+
+        assert completer.get_word_under_cursor(document) == ("docs/i", 16)
+
+    def test_directory_listing_is_cached_until_changed(self, tmp_path, monkeypatch):
+        """Test that completions reuse the listing until the directory changes."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "alpha.py").write_text("")
+        (tmp_path / "assets").mkdir()
+        completer = SmartPathCompleter()
+
+        with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+            assert sorted(completer.get_path_completions("a")) == [
+                ("alpha.py", "Source code"),
+                ("assets/", "Directory"),
+            ]
+            assert len(list(completer.get_path_completions("al"))) == 1
+            assert mock_scandir.call_count == 1
+
+            (tmp_path / "about.md").write_text("")
+            os.utime(tmp_path, ns=(0, os.stat(tmp_path).st_mtime_ns + 1))
+            assert ("about.md", "Text file") in list(completer.get_path_completions("a"))
+            assert mock_scandir.call_count == 2
+
+    def test_descriptions_are_cached_with_listing(self, tmp_path, monkeypatch):
+        """Test that file descriptions are computed once per directory listing."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "main.py").write_text("")
+        completer = SmartPathCompleter()
+
+        with patch(
+            "q_cli.io.completion.describe_file", return_value="Source code"
+        ) as mock_describe:
+            list(completer.get_path_completions("m"))
+            list(completer.get_path_completions("ma"))
+
+        assert mock_describe.call_count == 1
+
+    def test_current_directory_completions(self, tmp_path, monkeypatch):
+        """Test bare-name completions, which hide dotfiles until a dot is typed."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "data.json").write_text("")
+        (tmp_path / ".env").write_text("")
+        completer = SmartPathCompleter()
+
+        assert sorted(completer.get_path_completions("")) == [
+            ("data.json", "Config file"),
+            ("docs/", "Directory"),
+        ]
+        assert list(completer.get_path_completions("do")) == [("docs/", "Directory")]
+        assert list(completer.get_path_completions(".e")) == [(".env", "File")]
+
+    def test_nested_path_completions(self, tmp_path, monkeypatch):
+        """Test completions inside a subdirectory, including hidden entries."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "main.py").write_text("")
+        (tmp_path / "src" / ".hidden").write_text("")
+        (tmp_path / "src" / "[draft].md").write_text("")
+        completer = SmartPathCompleter()
+
+        assert sorted(completer.get_path_completions("src/")) == [
+            ("src/[draft].md", "Text file"),
+            ("src/main.py", "Source code"),
+            ("src/pkg/", "Directory"),
+        ]
+        assert list(completer.get_path_completions("src/m")) == [("src/main.py", "Source code")]
+        assert list(completer.get_path_completions("src/[d")) == [("src/[draft].md", "Text file")]
+        assert list(completer.get_path_completions("src/.h")) == [("src/.hidden", "File")]
+        assert list(completer.get_path_completions("missing/x")) == []
+        assert list(completer.get_path_completions("src/main.py/x")) == []
+        assert list(completer.get_path_completions("x" * 5000 + "/y")) == []
+
+    def test_root_directory_completions(self):
+        """Test that completions under "/" don't get a doubled slash."""
+        completer = SmartPathCompleter()
+
+        assert all(
+            not text.startswith("//") for text, _ in completer.get_path_completions("/")
+        )
+
+    def test_home_directory_completions(self, tmp_path):
+        """Test that "~/" paths complete from the user's home directory."""
+        (tmp_path / "notes.txt").write_text("")
+        completer = SmartPathCompleter()
+
+        with patch("q_cli.io.completion._USER_HOME", str(tmp_path)):
+            assert list(completer.get_path_completions("~/no")) == [
+                (os.path.join(str(tmp_path), "notes.txt"), "Text file")
+            ]
+
+    def test_completions_are_capped(self, tmp_path, monkeypatch):
+        """Test that completion stops after MAX_PATH_COMPLETIONS entries."""
+        monkeypatch.chdir(tmp_path)
+        for i in range(5):
+            (tmp_path / f"file{i}.txt").write_text("")
+        completer = SmartPathCompleter()
+
+        with patch("q_cli.io.completion.MAX_PATH_COMPLETIONS", 3):
+            completions = list(completer.get_completions(Document("file"), None))
+
+        assert len(completions) == 3
+        assert all(completion.start_position == -4 for completion in completions)
@@ -0,0 +1,374 @@
+"""Tests for the io.config module."""
+
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from q_cli.io.config import (
+    MMAP_READ_THRESHOLD,
+    _walk_tree_lines,
+    build_context,
+    clear_file_tree_cache,
+    generate_file_tree,
+    read_context_file,
+)
+from q_cli.config.providers import GROQ_MAX_CONTEXT_TOKENS
+from q_cli.utils.constants import REDACTED_TEXT
+
+
+class TestReadContextFile:
+    """Tests for read_context_file."""
+
+    def _write_temp(self, content: str) -> str:
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".md") as f:
+            f.write(content)
+            return f.name
+
+    def test_redacts_sensitive_lines(self, mock_console):
+        """Test that lines with sensitive info are redacted."""
+        path = self._write_temp("first line\nmy api_key=abc\nlast line")
+        try:
+            result = read_context_file(path, mock_console)
+        finally:
+            os.unlink(path)
+
+        assert result == f"first line\n{REDACTED_TEXT}\nlast line"
+
+    def test_large_file_matches_small_file_behaviour(self, mock_console):
+        """Test that large files read through mmap produce the same output."""
+        filler = "plain text line\n" * (MMAP_READ_THRESHOLD // 16 + 1)
+        path = self._write_temp(filler + "secret=abc\nend")
+        try:
+            result = read_context_file(path, mock_console)
+        finally:
+            os.unlink(path)
+
+        assert result.endswith(f"\n{REDACTED_TEXT}\nend")
+        assert result.startswith("plain text line\n")
+
+    def test_crlf_newlines_are_normalized(self, mock_console, tmp_path):
+        """Test that Windows line endings are normalized as in text mode."""
+        path = tmp_path / "context.md"
+        path.write_bytes(b"one\r\ntoken here\r\nthree\r")
+
+        assert read_context_file(str(path), mock_console) == f"one\n{REDACTED_TEXT}\nthree\n"
+
+    def test_large_file_crlf_newlines_are_normalized(self, mock_console, tmp_path):
+        """Test that newline normalization also applies to mmap-read files."""
+        path = tmp_path / "context.md"
+        path.write_bytes(b"plain\r\n" * (MMAP_READ_THRESHOLD // 7 + 1) + b"key\rend")
+
+        result = read_context_file(str(path), mock_console)
+
+        assert "\r" not in result
+        assert result.endswith(f"plain\n{REDACTED_TEXT}\nend")
+
+    def test_oversized_file_is_skipped(self, mock_console, tmp_path):
+        """Test that files over the size cap are skipped with a warning."""
+        path = tmp_path / "huge.md"
+        path.write_text("small content")
+
+        with patch("q_cli.io.config.MAX_CONTEXT_FILE_SIZE", 4):
+            assert read_context_file(str(path), mock_console) == ""
+        mock_console.print.assert_called_once()
+        assert "Skipping" in mock_console.print.call_args[0][0]
+
+    def test_only_cached_reads_are_reused(self, mock_console, tmp_path, monkeypatch):
+        """Test that contents are cached only on request, once per absolute path."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "context.md").write_text("cached content")
+
+        with patch(
+            "q_cli.io.config._read_redacted_text", return_value="cached content"
+        ) as mock_read:
+            read_context_file("context.md", mock_console)
+            read_context_file("context.md", mock_console)
+            assert mock_read.call_count == 2
+
+            read_context_file("context.md", mock_console, cache=True)
+            read_context_file(str(tmp_path / "context.md"), mock_console, cache=True)
+            assert mock_read.call_count == 3
+
+    def test_missing_file_returns_empty_string(self, mock_console):
+        """Test that a missing file returns an empty string with a warning."""
+        result = read_context_file("/nonexistent/path/context.md", mock_console)
+
+        assert result == ""
+        mock_console.print.assert_called_once()
+
+
+class TestWalkTreeLines:
+    """Tests for the in-process file tree walk."""
+
+    def test_renders_nested_tree(self, tmp_path):
+        """Test that nested directories are drawn with the right connectors."""
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "a.py").write_text("")
+        (tmp_path / "src" / "pkg" / "b.py").write_text("")
+        (tmp_path / "README.md").write_text("")
+
+        assert _walk_tree_lines(str(tmp_path)) == ([
+            ".",
+            "README.md",
+            "src",
+            "   ├─ a.py",
+            "   └─ pkg",
+            "      └─ b.py",
+        ], 0)
+
+    def test_skips_hidden_and_excluded_entries(self, tmp_path):
+        """Test that hidden and excluded directories are left out."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / ".env").write_text("")
+        (tmp_path / "README.md").write_text("")
+
+        assert _walk_tree_lines(str(tmp_path)) == ([
+            ".",
+            "README.md",
+            "src",
+            "   └─ main.py",
+        ], 0)
+
+    def test_respects_max_depth(self, tmp_path):
+        """Test that the walk stops descending at max_depth."""
+        (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+
+        assert _walk_tree_lines(str(tmp_path), max_depth=2) == ([".", "a", "   └─ b"], 0)
+
+    def test_stops_at_max_entries(self, tmp_path):
+        """Test that the walk stops once max_entries lines are emitted."""
+        for name in ("a", "b", "c", "d"):
+            (tmp_path / name).write_text("")
+
+        assert _walk_tree_lines(str(tmp_path), max_entries=3) == ([".", "a", "b"], 2)
+        assert _walk_tree_lines(str(tmp_path), max_entries=5) == (
+            [".", "a", "b", "c", "d"],
+            0,
+        )
+
+    def test_counts_omitted_entries_at_every_level(self, tmp_path):
+        """Test that listed entries left on every open level are counted."""
+        (tmp_path / "a").mkdir()
+        for name in ("x", "y", "z"):
+            (tmp_path / "a" / name).write_text("")
+        (tmp_path / "b").write_text("")
+
+        assert _walk_tree_lines(str(tmp_path), max_entries=3) == (
+            [".", "a", "│  ├─ x"],
+            3,
+        )
+
+    def test_empty_directory(self, tmp_path):
+        """Test that an empty directory renders only the root."""
+        assert _walk_tree_lines(str(tmp_path)) == (["."], 0)
+
+
+class TestGenerateFileTree:
+    """Tests for generate_file_tree."""
+
+    @patch("q_cli.io.config._find_tree_command", return_value=None)
+    def test_tree_is_cached_until_directory_changes(self, _mock_find_tree, mock_console, tmp_path):
+        """Test that the tree is reused until the directory mtime changes."""
+        clear_file_tree_cache()
+        (tmp_path / "a.py").write_text("")
+
+        with patch("os.getcwd", return_value=str(tmp_path)):
+            with patch("q_cli.io.config._walk_tree_lines", wraps=_walk_tree_lines) as mock_walk:
+                assert generate_file_tree(mock_console) == ".\na.py"
+                assert generate_file_tree(mock_console) == ".\na.py"
+                assert mock_walk.call_count == 1
+
+                (tmp_path / "b.py").write_text("")
+                os.utime(tmp_path, ns=(0, os.stat(tmp_path).st_mtime_ns + 1))
+                assert generate_file_tree(mock_console) == ".\na.py\nb.py"
+                assert mock_walk.call_count == 2
+
+                clear_file_tree_cache()
+                assert generate_file_tree(mock_console) == ".\na.py\nb.py"
+                assert mock_walk.call_count == 3
+
+    @patch("q_cli.io.config._find_tree_command", return_value=None)
+    @patch("q_cli.io.config.get_debug", return_value=True)
+    def test_debug_messages_only_on_generation(
+        self, _mock_debug, _mock_find_tree, mock_console, tmp_path
+    ):
+        """Test that build messages aren't repeated for a cached tree."""
+        clear_file_tree_cache()
+        (tmp_path / "a.py").write_text("")
+
+        with patch("os.getcwd", return_value=str(tmp_path)):
+            generate_file_tree(mock_console)
+            generate_file_tree(mock_console)
+
+        printed = [c.args[0] for c in mock_console.print.call_args_list]
+        assert printed == [
+            "[info]Generated file tree with 2 entries[/info]",
+            "[info]Reusing cached file tree[/info]",
+        ]
+
+    @patch("q_cli.io.config._find_tree_command")
+    def test_tree_command_is_opt_in(self, mock_find_tree, mock_console, tmp_path):
+        """Test that the external tree command is only used when enabled."""
+        clear_file_tree_cache()
+        (tmp_path / "a.py").write_text("")
+
+        with patch("os.getcwd", return_value=str(tmp_path)):
+            with patch.dict(os.environ, {"Q_USE_TREE_COMMAND": "0"}):
+                assert generate_file_tree(mock_console) == ".\na.py"
+            mock_find_tree.assert_not_called()
+
+            mock_find_tree.return_value = None
+            with patch.dict(os.environ, {"Q_USE_TREE_COMMAND": "1"}):
+                assert generate_file_tree(mock_console) == ".\na.py"
+            mock_find_tree.assert_called_once()
+
+    @patch("q_cli.io.config._find_tree_command", return_value="/opt/bin/tree")
+    def test_tree_command_runs_resolved_path(self, _mock_find_tree, mock_console, tmp_path):
+        """Test that the tree binary found on PATH is executed directly."""
+        clear_file_tree_cache()
+
+        with patch("os.getcwd", return_value=str(tmp_path)):
+            with patch.dict(os.environ, {"Q_USE_TREE_COMMAND": "1"}):
+                with patch("subprocess.run") as mock_run:
+                    mock_run.return_value = SimpleNamespace(
+                        returncode=0, stdout=b".\nx.py\n\xff.txt\n"
+                    )
+                    assert generate_file_tree(mock_console) == ".\nx.py\n\ufffd.txt"
+
+        assert mock_run.call_args[0][0][0] == "/opt/bin/tree"
+
+
+class TestBuildContext:
+    """Tests for build_context."""
+
+    @patch("q_cli.io.config.INCLUDE_FILE_TREE", False)
+    def test_multiple_context_files_keep_order(self, mock_console, tmp_path):
+        """Test that context files read concurrently are added in order."""
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"file{i}.md"
+            path.write_text(f"content {i}")
+            paths.append(str(path))
+
+        args = SimpleNamespace(
+            provider="anthropic",
+            max_context_tokens=100000,
+            no_context=True,
+            context_file=paths,
+        )
+        with patch("os.getcwd", return_value=str(tmp_path)):
+            context, _ = build_context(args, "", mock_console, {})
+
+        positions = [context.index(f"content {i}") for i in range(4)]
+        assert positions == sorted(positions)
+
+    @patch("q_cli.io.config.INCLUDE_FILE_TREE", False)
+    def test_q_directory_listing_and_project_md(self, mock_console, tmp_path):
+        """Test that .Q files are listed in sorted order and project.md is read."""
+        q_dir = tmp_path / ".Q"
+        q_dir.mkdir()
+        (q_dir / "project.md").write_text("Project details")
+        (q_dir / "b.md").write_text("b")
+        (q_dir / "a.md").write_text("a")
+
+        args = SimpleNamespace(
+            provider="anthropic",
+            max_context_tokens=100000,
+            no_context=True,
+            context_file=None,
+        )
+        with patch("os.getcwd", return_value=str(tmp_path)):
+            context, _ = build_context(args, "", mock_console, {})
+
+        assert "- a.md\n- b.md\n- project.md" in context
+        assert "Project Information:\nProject details" in context
+
+    @patch("q_cli.io.config.INCLUDE_FILE_TREE", False)
+    def test_context_files_and_project_md_read_together(self, mock_console, tmp_path):
+        """Test that project.md is read alongside the context files."""
+        q_dir = tmp_path / ".Q"
+        q_dir.mkdir()
+        (q_dir / "project.md").write_text("Project details")
+        context_file = tmp_path / "notes.md"
+        context_file.write_text("Some notes")
+
+        args = SimpleNamespace(
+            provider="anthropic",
+            max_context_tokens=100000,
+            no_context=True,
+            context_file=[str(context_file)],
+        )
+        with patch("os.getcwd", return_value=str(tmp_path)):
+            with patch("q_cli.io.config.read_context_file", wraps=read_context_file) as mock_read:
+                context, _ = build_context(args, "", mock_console, {})
+
+        assert mock_read.call_count == 2
+        assert "Content from notes.md:\nSome notes" in context
+        assert "Project Information:\nProject details" in context
+        assert context.index("Some notes") < context.index("Project details")
+
+    @patch("q_cli.io.config.INCLUDE_FILE_TREE", False)
+    def test_q_directory_and_project_md_cached_until_changed(self, mock_console, tmp_path):
+        """Test that .Q is rescanned and project.md reread only after changes."""
+        q_dir = tmp_path / ".Q"
+        q_dir.mkdir()
+        project_md = q_dir / "project.md"
+        project_md.write_text("Version one")
+
+        args = SimpleNamespace(
+            provider="anthropic",
+            max_context_tokens=100000,
+            no_context=True,
+            context_file=None,
+        )
+        with patch("os.getcwd", return_value=str(tmp_path)):
+            with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+                build_context(args, "", mock_console, {})
+                context, _ = build_context(args, "", mock_console, {})
+                assert mock_scandir.call_count == 1
+                assert "Version one" in context
+
+                project_md.write_text("Version two, longer")
+                (q_dir / "notes.md").write_text("")
+                os.utime(q_dir, ns=(0, os.stat(q_dir).st_mtime_ns + 1))
+                context, _ = build_context(args, "", mock_console, {})
+
+        assert mock_scandir.call_count == 2
+        assert "Version two, longer" in context
+        assert "- notes.md" in context
+
+    @patch("q_cli.io.config.INCLUDE_FILE_TREE", True)
+    def test_file_tree_skipped_when_budget_is_full(self, mock_console, tmp_path):
+        """Test that the file tree isn't generated when it would be trimmed."""
+        args = SimpleNamespace(
+            provider="anthropic",
+            max_context_tokens=100,
+            no_context=True,
+            context_file=None,
+        )
+        with patch("os.getcwd", return_value=str(tmp_path)):
+            with patch("q_cli.io.config.generate_file_tree") as mock_tree:
+                build_context(args, "", mock_console, {})
+
+        mock_tree.assert_not_called()
+
+    @patch("q_cli.io.config.INCLUDE_FILE_TREE", False)
+    def test_max_context_tokens_from_config(self, mock_console, tmp_path):
+        """Test that a commented config override sets the context token limit."""
+        args = SimpleNamespace(
+            provider="groq",
+            max_context_tokens=None,
+            no_context=True,
+            context_file=None,
+        )
+        config_vars = {"GROQ_MAX_CONTEXT_TOKENS": "5000  # Smaller limit"}
+        with patch("os.getcwd", return_value=str(tmp_path)):
+            _, context_manager = build_context(args, "", mock_console, config_vars)
+            assert context_manager.max_tokens == 5000
+
+            _, context_manager = build_context(args, "", mock_console, {})
+            assert context_manager.max_tokens == GROQ_MAX_CONTEXT_TOKENS
@@ -3,7 +3,17 @@
 import pytest
 from unittest.mock import patch, MagicMock, call
 
-from q_cli.io.input import confirm_context
+from prompt_toolkit.keys import Keys
+
+from q_cli.io.input import (
+    confirm_context,
+    create_key_bindings,
+    create_prompt_session,
+    get_initial_question,
+    create_prompt_style,
+    get_prompt_history,
+    get_input,
+)
 
 
 class TestInput:
@@ -85,4 +95,152 @@ class TestInput:
         assert mock_get_input.call_args_list[0] == call("Proceed with this system prompt? [Y/n] ", session=prompt_session)
         assert mock_get_input.call_args_list[1] == call("Proceed with this system prompt? [Y/n] ", session=prompt_session)
         # Check that warning was printed
-        console.print.assert_any_call("Please answer Y or N", style="warning")
\ No newline at end of file
+        console.print.assert_any_call("Please answer Y or N", style="warning")
+
+    @patch("q_cli.io.input.get_input", side_effect=["  Yes please ", " NO"])
+    def test_confirm_context_uses_first_letter(self, _mock_get_input):
+        """Test that answers are decided by their first non-blank letter."""
+        assert confirm_context(MagicMock(), "prompt", MagicMock()) is True
+        assert confirm_context(MagicMock(), "prompt", MagicMock()) is False
+
+    @patch("q_cli.io.input.get_input", return_value="y")
+    def test_confirm_context_reuses_rendered_prompt(self, _mock_get_input):
+        """Test that an unchanged system prompt is only rendered once."""
+        with patch("q_cli.utils.helpers.format_markdown") as mock_format:
+            confirm_context(MagicMock(), "reused system prompt", MagicMock())
+            confirm_context(MagicMock(), "reused system prompt", MagicMock())
+            confirm_context(MagicMock(), "changed system prompt", MagicMock())
+
+        assert mock_format.call_count == 2
+
+    def test_get_input_exit_commands(self):
+        """Test that exit commands end the program and other input is returned."""
+        session = MagicMock()
+
+        for command in ("exit", "  QUIT  ", "q"):
+            session.prompt.return_value = command
+            with pytest.raises(SystemExit):
+                get_input("Q> ", session=session)
+
+        session.prompt.return_value = "quit smoking tips"
+        assert get_input("Q> ", session=session) == "quit smoking tips"
+
+    def test_get_input_reuses_formatted_prompt(self):
+        """Test that the same prompt text is only parsed into HTML once."""
+        session = MagicMock()
+        session.prompt.return_value = "hello"
+
+        get_input("Q> ", session=session)
+        get_input("Q> ", session=session)
+
+        first, second = (c.args[0] for c in session.prompt.call_args_list)
+        assert first is second
+
+    def test_key_bindings_and_style_are_shared(self):
+        """Test that prompt sessions reuse the same key bindings and style."""
+        assert create_key_bindings() is create_key_bindings()
+        assert create_prompt_style() is create_prompt_style()
+
+    def test_prompt_sessions_share_history(self, mock_console, tmp_path):
+        """Test that every prompt session uses the same history object."""
+        get_prompt_history.cache_clear()
+        try:
+            with patch("q_cli.io.input.HISTORY_PATH", str(tmp_path / "history")):
+                first = create_prompt_session(mock_console)
+                second = create_prompt_session(mock_console)
+
+            assert first.history is second.history
+            assert first.history is get_prompt_history()
+        finally:
+            get_prompt_history.cache_clear()
+
+    def test_initial_question_from_file(self, tmp_path):
+        """Test that a question file is decoded with normalized newlines."""
+        path = tmp_path / "question.txt"
+        path.write_bytes(b"line one\r\nline two \xff\r\n")
+        args = MagicMock(interactive=False, file=str(path))
+        history = MagicMock()
+
+        question = get_initial_question(args, MagicMock(), history)
+
+        assert question == "line one\nline two \ufffd\n"
+        history.append_string.assert_called_once_with("line one\nline two \ufffd")
+
+    @patch("q_cli.io.input.get_input", side_effect=["  ", "hello"])
+    def test_initial_question_reprompts_when_no_empty(self, mock_get_input):
+        """Test that blank prompts are re-asked only when --no-empty is set."""
+        args = MagicMock(interactive=True, no_empty=True)
+
+        assert get_initial_question(args, MagicMock(), MagicMock()) == "hello"
+        assert mock_get_input.call_count == 2
+
+    def test_enter_hint_uses_session_console(self):
+        """Test that the multiline hint prints on the console the bindings were built with."""
+        console = MagicMock()
+        bindings = create_key_bindings(console)
+        handler = next(
+            binding.handler
+            for binding in bindings.bindings
+            if binding.keys == (Keys.ControlM,)
+        )
+
+        event = MagicMock()
+        event.current_buffer = MagicMock(spec=["text", "validate_and_handle"])
+        event.current_buffer.text = "line one\nline two"
+        with patch("q_cli.io.input.Console") as mock_console_cls:
+            handler(event)
+
+        console.print.assert_called_once()
+        mock_console_cls.assert_not_called()
+        event.current_buffer.validate_and_handle.assert_not_called()
+
+    def test_double_escape_aborts_prompt(self):
+        """Test that double Escape exits the prompt like Ctrl+C."""
+        bindings = create_key_bindings()
+        handler = next(
+            binding.handler
+            for binding in bindings.bindings
+            if binding.keys == (Keys.Escape, Keys.Escape)
+        )
+
+        event = MagicMock()
+        handler(event)
+
+        event.app.exit.assert_called_once_with(
+            exception=KeyboardInterrupt, style="class:aborting"
+        )
+
+    def test_enter_ignores_blank_buffer(self):
+        """Test that Enter only submits when the buffer has non-blank text."""
+        bindings = create_key_bindings()
+        handler = next(
+            binding.handler
+            for binding in bindings.bindings
+            if binding.keys == (Keys.ControlM,)
+        )
+
+        blank = MagicMock()
+        blank.current_buffer.text = " \t "
+        handler(blank)
+        blank.current_buffer.validate_and_handle.assert_not_called()
+
+        filled = MagicMock()
+        filled.current_buffer.text = " hello "
+        handler(filled)
+        filled.current_buffer.validate_and_handle.assert_called_once_with()
+
+
+def test_import_does_not_load_prompt_toolkit():
+    """Test that importing the input module doesn't import prompt_toolkit."""
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, q_cli.io.input; sys.exit('prompt_toolkit' in sys.modules)",
+        ],
+        capture_output=True,
+    )
+    assert result.returncode == 0
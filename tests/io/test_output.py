@@ -0,0 +1,27 @@
+"""Tests for output module."""
+
+from unittest.mock import MagicMock
+
+from q_cli.io.output import save_response_to_file
+
+
+class TestOutput:
+    """Tests for output functions."""
+
+    def test_save_response_creates_directories(self, tmp_path):
+        """Test that missing directories are created and existing ones reused."""
+        target = tmp_path / "a" / "b" / "response.md"
+        console = MagicMock()
+
+        assert save_response_to_file("first", str(target), console) is True
+        assert save_response_to_file("second", str(target), console) is True
+
+        assert target.read_text() == "second"
+        console.print.assert_not_called()
+
+    def test_save_response_reports_errors(self, tmp_path):
+        """Test that a failed save is reported and returns False."""
+        console = MagicMock()
+
+        assert save_response_to_file("text", str(tmp_path), console) is False
+        console.print.assert_called_once()
@@ -220,4 +220,71 @@ class TestLLMClient:
                 messages=[{"role": "user", "content": "Hello"}]
             )
         
-        assert "RATE_LIMIT" in str(excinfo.value)
\ No newline at end of file
+        assert "RATE_LIMIT" in str(excinfo.value)
+
+    @patch('q_cli.utils.provider_factory.ProviderFactory.create_provider')
+    @patch('litellm.completion')
+    def test_provider_error_messages(self, mock_completion, mock_create_provider):
+        """Test that provider messages replace matching errors, built once per client."""
+        mock_provider = MagicMock(spec=AnthropicProviderConfig)
+        mock_provider.get_provider_name.return_value = "anthropic"
+        mock_provider.format_model_name.return_value = "anthropic/claude-3-sonnet-latest"
+        mock_provider.MAX_TOKENS = 8192
+        mock_provider.get_error_handler.return_value = {
+            "PERMISSION_DENIED": {"message": "Check your permissions", "resolution": "Fix IAM"}
+        }
+        mock_create_provider.return_value = mock_provider
+        client = LLMClient()
+
+        request = dict(
+            model="anthropic/claude-3-sonnet-latest",
+            max_tokens=1000,
+            temperature=0,
+            system=None,
+            messages=[{"role": "user", "content": "Hello"}],
+        )
+
+        mock_completion.side_effect = litellm.exceptions.BadRequestError(
+            message="PERMISSION_DENIED: no access",
+            model="claude-3-sonnet-latest",
+            llm_provider="anthropic",
+        )
+        with pytest.raises(Exception, match="Check your permissions") as excinfo:
+            client.messages_create(**request)
+        assert "PERMISSION_DENIED: no access" in str(excinfo.value)
+
+        mock_completion.side_effect = RuntimeError("PERMISSION_DENIED elsewhere")
+        with pytest.raises(Exception, match="Check your permissions"):
+            client.messages_create(**request)
+
+        mock_completion.side_effect = RuntimeError("something else")
+        with pytest.raises(RuntimeError, match="something else"):
+            client.messages_create(**request)
+
+        assert mock_provider.get_error_handler.call_count == 1
+
+    @patch('q_cli.utils.provider_factory.ProviderFactory.create_provider')
+    def test_streaming_chunks_share_one_class(self, mock_create_provider):
+        """Test that streamed chunks are instances of one module-level class."""
+        mock_provider = MagicMock(spec=AnthropicProviderConfig)
+        mock_provider.get_provider_name.return_value = "anthropic"
+        mock_provider.format_model_name.return_value = "anthropic/claude-3-sonnet-latest"
+        mock_create_provider.return_value = mock_provider
+        client = LLMClient()
+
+        chunks = []
+        for text in ("Hel", "lo"):
+            chunk = MagicMock()
+            chunk.id = "chunk-id"
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = text
+            chunk.choices[0].finish_reason = None
+            chunks.append(chunk)
+
+        first, second = client._transform_streaming_response(chunks)
+
+        assert type(first) is type(second)
+        assert not hasattr(first, "__dict__")
+        assert [first.content[0].text, second.content[0].text] == ["Hel", "lo"]
+        assert first["id"] == "chunk-id"
+        assert first.to_dict()["object"] == "chat.completion.chunk"
@@ -23,6 +23,7 @@ from q_cli.utils.commands import (
     read_file_from_marker,
     process_file_writes,
     process_file_reads,
+    is_line_continuation,
 )
 
 # Constants for testing
@@ -319,4 +320,13 @@ class TestProcessFileOperations:
         assert len(file_results) == 1
         assert file_results[0]["success"] is True
         assert has_error is False
-        assert len(multimodal_results) == 0
\ No newline at end of file
+        assert len(multimodal_results) == 0
+
+    def test_is_line_continuation(self):
+        """Test that only an odd run of trailing backslashes continues a line."""
+        assert is_line_continuation("echo one \\")
+        assert is_line_continuation("echo one \\  ")
+        assert is_line_continuation("echo \\\\\\")
+        assert not is_line_continuation("echo one \\\\")
+        assert not is_line_continuation("echo one")
+        assert not is_line_continuation("")
@@ -0,0 +1,43 @@
+"""Tests for the context management module."""
+
+from unittest.mock import MagicMock, patch
+
+from q_cli.utils.context import ContextManager
+from q_cli.utils.constants import (
+    ESSENTIAL_PRIORITY,
+    IMPORTANT_PRIORITY,
+    SUPPLEMENTARY_PRIORITY,
+)
+
+
+@patch("q_cli.utils.context.num_tokens_from_string", side_effect=len)
+class TestContextManager:
+    """Tests for the ContextManager class."""
+
+    def test_remaining_budget_empty(self, _mock_tokens):
+        """Test the budgets of an empty context manager."""
+        manager = ContextManager(max_tokens=1000, console=MagicMock())
+
+        # Unused essential tokens are reclaimed by the other priorities
+        assert manager.remaining_budget(IMPORTANT_PRIORITY) == 700
+        assert manager.remaining_budget(SUPPLEMENTARY_PRIORITY) == 1000
+
+    def test_remaining_budget_after_adding_items(self, _mock_tokens):
+        """Test that added items and the system prompt reduce the budgets."""
+        manager = ContextManager(max_tokens=1000, console=MagicMock())
+        manager.set_system_prompt("x" * 100)
+        manager.add_context("x" * 500, IMPORTANT_PRIORITY, "Big file")
+
+        assert manager.remaining_budget(IMPORTANT_PRIORITY) == 130
+        assert manager.remaining_budget(SUPPLEMENTARY_PRIORITY) == 400
+
+        manager.add_context("x" * 5000, ESSENTIAL_PRIORITY, "Huge item")
+        assert manager.remaining_budget(ESSENTIAL_PRIORITY) == 0
+        assert manager.remaining_budget(IMPORTANT_PRIORITY) == 0
+
+    def test_remaining_budget_system_prompt_over_limit(self, _mock_tokens):
+        """Test that no budget remains when the system prompt fills the limit."""
+        manager = ContextManager(max_tokens=100, console=MagicMock())
+        manager.set_system_prompt("x" * 200)
+
+        assert manager.remaining_budget(IMPORTANT_PRIORITY) == 0
@@ -12,8 +12,12 @@ from q_cli.utils.helpers import (
     is_newer_version,
     clean_operation_codeblocks,
     expand_env_vars,
-    get_working_and_project_dirs
+    redact_sensitive_lines,
+    redact_sensitive_bytes,
+    get_working_and_project_dirs,
+    _drop_subsumed_patterns,
 )
+from q_cli.utils.constants import REDACTED_TEXT
 
 
 class TestHelpers:
@@ -95,6 +99,40 @@ class TestHelpers:
             # Test with no variables
             assert expand_env_vars("Plain text") == "Plain text"
 
+        # Test with an explicit environment snapshot
+        env = {"A": "1", "B": "2"}
+        assert expand_env_vars("$A-${B}-$C", env) == "1-2-"
+
+        # Cached templates still resolve against the current environment
+        assert expand_env_vars("$A-${B}-$C", {"C": "3"}) == "--3"
+
+    def test_redact_sensitive_lines(self):
+        """Test that only lines with sensitive info are redacted."""
+        text = "first\nMy API_KEY=abc\nmiddle\nSecret value\nlast"
+        assert redact_sensitive_lines(text) == (
+            f"first\n{REDACTED_TEXT}\nmiddle\n{REDACTED_TEXT}\nlast"
+        )
+
+        # Clean text is returned unchanged
+        assert redact_sensitive_lines("nothing to see\nhere") == "nothing to see\nhere"
+
+        # Several matches on one line produce a single redaction
+        assert redact_sensitive_lines("token and secret") == REDACTED_TEXT
+
+    def test_drop_subsumed_patterns(self):
+        """Test that patterns covered by a shorter pattern are removed."""
+        patterns = ["sk-ant", "sk-", "api_key", "KEY", "oauth", "auth", "gpt"]
+        assert _drop_subsumed_patterns(patterns) == ["sk-", "KEY", "auth", "gpt"]
+
+    def test_redact_sensitive_bytes(self):
+        """Test that byte-level redaction matches the text variant."""
+        text = "first\nMy API_KEY=abc\nmiddle\nSecret value\nlast"
+        assert redact_sensitive_bytes(text.encode()) == redact_sensitive_lines(text).encode()
+
+        # Clean input is returned as the same object
+        data = b"nothing to see\nhere"
+        assert redact_sensitive_bytes(data) is data
+
     def test_clean_operation_codeblocks(self):
         """Test cleaning of code blocks around operations."""
         # Test with code block wrapping
@@ -206,4 +244,26 @@ class TestHelpers:
         result = get_working_and_project_dirs()
         assert "Current Working Directory: /home/user/projects/myproject/subdir" in result
         assert "Project Root Directory: Unknown" in result
-        assert "Project Files:" not in result
\ No newline at end of file
+        assert "Project Files:" not in result
+
+    def test_get_working_and_project_dirs_prunes_hidden(self, tmp_path, monkeypatch):
+        """Test that the project file walk never descends into hidden directories."""
+        (tmp_path / ".git" / "objects").mkdir(parents=True)
+        (tmp_path / ".git" / "objects" / "blob").write_text("")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("")
+        monkeypatch.chdir(tmp_path)
+
+        walked = []
+        real_walk = os.walk
+
+        def recording_walk(top):
+            for root, dirs, files in real_walk(top):
+                walked.append(root)
+                yield root, dirs, files
+
+        with patch("os.walk", side_effect=recording_walk):
+            result = get_working_and_project_dirs()
+
+        assert os.path.join(str(tmp_path), "src", "main.py") in result
+        assert not any(".git" in root for root in walked)